@@ -2,6 +2,8 @@
 List GTM projects command
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
@@ -9,25 +11,33 @@ from rich.table import Table
 from rich.panel import Panel
 from datetime import datetime
 import json
+import typer
 
-from cli.services.project_storage import project_storage
+from cli.services.project_storage import project_storage, read_metadata_cached
 from cli.utils.colors import Colors
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 console = Console()
 
-def list_projects(domain_filter: Optional[str] = None) -> None:
+SORT_CHOICES = ("name", "date")
+
+# Upper bound on threads used to scan project directories
+MAX_SCAN_WORKERS = 16
+
+def list_projects(domain_filter: Optional[str] = None, sort_by: str = "name") -> None:
     """List all GTM projects or files for a specific domain"""
     
-    # Get gtm_projects directory
-    gtm_projects_dir = Path("gtm_projects")
-    
-    if not gtm_projects_dir.exists():
-        console.print(f"[yellow]No GTM projects found.[/yellow]")
-        console.print(f"→ Create your first project: {Colors.format_command('blossomer init company.com')}")
-        return
+    if sort_by not in SORT_CHOICES:
+        console.print(f"[red]Error:[/red] Unknown sort order '{sort_by}'")
+        console.print(f"→ Valid options: {', '.join(SORT_CHOICES)}")
+        raise typer.Exit(1)
     
-    # Get all project directories
-    project_dirs = [d for d in gtm_projects_dir.iterdir() if d.is_dir()]
+    project_dirs = find_project_dirs(Path("gtm_projects"))
     
     if not project_dirs:
         console.print(f"[yellow]No GTM projects found.[/yellow]")
@@ -39,9 +49,26 @@ def list_projects(domain_filter: Optional[str] = None) -> None:
         show_project_files(domain_filter, project_dirs)
     else:
         # Show all projects
-        show_all_projects(project_dirs)
+        show_all_projects(project_dirs, sort_by)
+
+def find_project_dirs(gtm_projects_dir: Path) -> list[os.DirEntry]:
+    """Return the project directories under gtm_projects_dir, or [] if it doesn't exist"""
+    # Single scandir pass; DirEntry caches type info
+    try:
+        with os.scandir(gtm_projects_dir) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
 
-def show_all_projects(project_dirs: list[Path]) -> None:
+def sort_project_rows(scanned: list[tuple[Optional[datetime], tuple]], sort_by: str = "name") -> list[tuple]:
+    """Order scanned projects by name, or newest first by the metadata update time shown as Last Modified"""
+    by_name = sorted(scanned, key=lambda item: item[1][0])
+    if sort_by == "date":
+        # Projects without a readable update time go last, in name order (the sort is stable)
+        by_name.sort(key=lambda item: item[0].timestamp() if item[0] else float("-inf"), reverse=True)
+    return [row for _, row in by_name]
+
+def show_all_projects(project_dirs: list[os.DirEntry], sort_by: str = "name") -> None:
     """Show table of all GTM projects"""
     
     console.print()
@@ -58,64 +85,12 @@ def show_all_projects(project_dirs: list[Path]) -> None:
     table.add_column("Last Modified", min_width=15)
     table.add_column("Size", min_width=8, justify="right")
     
-    for project_dir in sorted(project_dirs, key=lambda x: x.name):
-        domain = project_dir.name
-        
-        # Get project metadata
-        metadata_file = project_dir / ".metadata.json"
-        status = "Unknown"
-        last_modified = "N/A"
-        
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    
-                # Determine status based on completed steps
-                steps_completed = metadata.get('steps_completed', [])
-                total_steps = 5  # overview, account, persona, email, plan
-                
-                if len(steps_completed) == total_steps:
-                    status = "[green]Complete[/green]"
-                elif len(steps_completed) > 0:
-                    status = f"[yellow]Partial ({len(steps_completed)}/{total_steps})[/yellow]"
-                else:
-                    status = "[red]Started[/red]"
-                
-                # Get last modified time
-                modified_at = metadata.get('modified_at')
-                if modified_at:
-                    try:
-                        dt = datetime.fromisoformat(modified_at.replace('Z', '+00:00'))
-                        last_modified = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        last_modified = "N/A"
-                        
-            except Exception:
-                status = "[red]Error[/red]"
-        
-        # Count markdown files in plans directory
-        plans_dir = project_dir / "plans"
-        file_count = len(list(plans_dir.glob("*.md"))) if plans_dir.exists() else 0
-        
-        # Calculate total size
-        total_size = 0
-        for file_path in project_dir.rglob("*"):
-            if file_path.is_file():
-                try:
-                    total_size += file_path.stat().st_size
-                except:
-                    pass
-        
-        size_str = format_size(total_size)
-        
-        table.add_row(
-            domain,
-            status,
-            str(file_count),
-            last_modified,
-            size_str
-        )
+    # Per-project reads are small and I/O bound; overlap them across threads
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(project_dirs))) as executor:
+        scanned = list(executor.map(scan_project, project_dirs))
+    
+    for row in sort_project_rows(scanned, sort_by):
+        table.add_row(*row)
     
     console.print(table)
     console.print()
@@ -123,14 +98,67 @@ def show_all_projects(project_dirs: list[Path]) -> None:
     console.print(f"→ View specific step: {Colors.format_command('blossomer show [step]')}")
     console.print()
 
-def show_project_files(domain: str, project_dirs: list[Path]) -> None:
+def scan_project(entry: os.DirEntry) -> tuple[Optional[datetime], tuple[str, str, str, str, str]]:
+    """Collect the last update time and table row for one project directory"""
+    domain = entry.name
+    project_dir = Path(entry.path)
+    
+    # Get project metadata
+    metadata_file = project_dir / ".metadata.json"
+    status = "Unknown"
+    updated_at = None
+    last_modified = "N/A"
+    
+    if metadata_file.exists():
+        try:
+            metadata = read_metadata_cached(metadata_file, read_project_header)
+            
+            # Determine status based on completed steps
+            steps_completed = metadata['completed_steps']
+            total_steps = 5  # overview, account, persona, email, plan
+            
+            if len(steps_completed) == total_steps:
+                status = "[green]Complete[/green]"
+            elif len(steps_completed) > 0:
+                status = f"[yellow]Partial ({len(steps_completed)}/{total_steps})[/yellow]"
+            else:
+                status = "[red]Started[/red]"
+            
+            # Get last modified time
+            modified_at = metadata['updated_at']
+            if modified_at:
+                try:
+                    updated_at = datetime.fromisoformat(modified_at.replace('Z', '+00:00'))
+                    last_modified = updated_at.strftime("%Y-%m-%d %H:%M")
+                except:
+                    last_modified = "N/A"
+        
+        except Exception:
+            status = "[red]Error[/red]"
+    
+    # Count markdown files in plans directory
+    plans_dir = project_dir / "plans"
+    file_count = len(list(plans_dir.glob("*.md"))) if plans_dir.exists() else 0
+    
+    # Calculate total size
+    size_str = format_size(get_directory_size(entry.path))
+    
+    return updated_at, (
+        domain,
+        status,
+        str(file_count),
+        last_modified,
+        size_str
+    )
+
+def show_project_files(domain: str, project_dirs: list[os.DirEntry]) -> None:
     """Show files for a specific project domain"""
     
     # Find matching project
     matching_project = None
-    for project_dir in project_dirs:
-        if project_dir.name == domain:
-            matching_project = project_dir
+    for entry in project_dirs:
+        if entry.name == domain:
+            matching_project = Path(entry.path)
             break
     
     if not matching_project:
@@ -189,6 +217,41 @@ def show_project_files(domain: str, project_dirs: list[Path]) -> None:
     console.print(f"→ Edit step: {Colors.format_command('blossomer edit --domain {domain} --step [step]')}")
     console.print()
 
+def parse_json_bytes(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def read_project_header(metadata_file: Path) -> dict:
+    """Read the completed steps and last update time shown in the project table"""
+    with open(metadata_file, 'rb') as f:
+        metadata = parse_json_bytes(f.read())
+    
+    # ProjectStorage writes completed_steps/updated_at; ProjectManager
+    # (cli/utils/file_manager.py) writes steps_completed/modified_at
+    return {
+        "completed_steps": metadata.get("completed_steps", metadata.get("steps_completed", [])),
+        "updated_at": metadata.get("updated_at", metadata.get("modified_at")),
+    }
+
+def get_directory_size(path: str) -> int:
+    """Sum file sizes under a directory using scandir's cached entry info"""
+    total_size = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total_size += get_directory_size(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total_size
+
 def format_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
     if size_bytes < 1024:
@@ -3,7 +3,7 @@ Show command implementation - Display generated GTM assets with Rich formatting
 """
 
 import json
-from typing import Optional
+from typing import Any, Dict, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -15,6 +15,9 @@ from cli.utils.domain import normalize_domain
 
 console = Console()
 
+# Single-step assets accepted by `blossomer show`, in display order
+SHOW_ASSETS = ("overview", "account", "persona", "email", "strategy")
+
 
 def show_assets(asset: str = "all", json_output: bool = False, domain: Optional[str] = None) -> None:
     """Display generated assets with rich formatting"""
@@ -41,23 +44,24 @@ def show_assets(asset: str = "all", json_output: bool = False, domain: Optional[
         return
     
     if asset == "all":
-        show_all_assets(normalized_domain, json_output)
-    elif asset in ["overview", "account", "persona", "email", "strategy"]:
+        show_all_assets(normalized_domain, json_output, status)
+    elif asset in SHOW_ASSETS:
         show_single_asset(normalized_domain, asset, json_output)
     else:
         console.print(f"[red]Unknown asset: {asset}[/red]")
-        console.print("Available assets: [bold #0066CC]all, overview, account, persona, email, strategy[/bold #0066CC]")
+        console.print(f"Available assets: [bold #0066CC]{', '.join(('all',) + SHOW_ASSETS)}[/bold #0066CC]")
 
 
-def show_all_assets(domain: str, json_output: bool = False) -> None:
+def show_all_assets(domain: str, json_output: bool = False, status: Optional[Dict[str, Any]] = None) -> None:
     """Show overview of all assets for a project"""
     
     if json_output:
         show_all_json(domain)
         return
     
-    # Project header
-    status = gtm_service.get_project_status(domain)
+    # Project header (reuse the caller's status to avoid rescanning the step files)
+    if status is None:
+        status = gtm_service.get_project_status(domain)
     
     console.print()
     console.print(Panel.fit(
@@ -7,6 +7,7 @@ import warnings
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL 1.1.1+", category=UserWarning)
 
 import asyncio
+import os
 import typer
 from typing import Optional
 from rich.console import Console
@@ -134,8 +135,9 @@ def main(
         from cli.utils.debug import set_debug_mode
         set_debug_mode(True)
     
-    # Configure console for no-color mode
-    if no_color:
+    # Configure console for no-color mode (NO_COLOR is the cross-tool convention;
+    # per no-color.org an empty NO_COLOR counts as unset and keeps colour on)
+    if no_color or os.environ.get("NO_COLOR"):
         console._color_system = None
     
     # If no command was invoked, show the welcome panel
@@ -191,12 +193,13 @@ def edit(
 
 @app.command()
 def list(
-    domain: Optional[str] = typer.Option(None, "--domain", help="Show files for specific domain only")
+    domain: Optional[str] = typer.Option(None, "--domain", help="Show files for specific domain only"),
+    sort: str = typer.Option("name", "--sort", help="Sort projects by 'name' or 'date' (last updated, newest first)")
 ) -> None:
     """📁 Show all GTM projects and their files."""
     from cli.commands.list_projects import list_projects
     
-    list_projects(domain)
+    list_projects(domain, sort_by=sort)
 
 
 @app.command()
@@ -4,7 +4,7 @@ GTM Generation Service - Orchestrates the complete 5-step GTM generation flow
 
 import logging
 from typing import Any, Dict, Optional
-from cli.services.project_storage import project_storage
+from cli.services.project_storage import ProjectStorage, project_storage
 from cli.services.product_overview_service import generate_product_overview_service
 from cli.services.target_account_service import generate_target_account_profile
 from cli.services.target_persona_service import generate_target_persona_profile
@@ -27,8 +27,9 @@ logger = logging.getLogger(__name__)
 class GTMGenerationService:
     """Orchestrates the complete GTM generation pipeline with file storage"""
     
-    def __init__(self):
-        self.storage = project_storage
+    def __init__(self, storage: Optional[ProjectStorage] = None):
+        # Defaults to the shared project storage used by the CLI commands
+        self.storage = storage if storage is not None else project_storage
     
     async def generate_company_overview(
         self, 
@@ -4,13 +4,28 @@ Project Storage Service - JSON file storage and retrieval for CLI GTM projects
 
 import json
 import logging
+import math
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from pydantic import BaseModel
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Parsed metadata files kept in-process; entries are revalidated by stat
+METADATA_CACHE_SIZE = 1024
+_metadata_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
 
 class ProjectMetadata(BaseModel):
     """Metadata for GTM project tracking"""
@@ -90,8 +105,7 @@ class ProjectStorage:
         json_output_dir = project_dir / "json_output"
         json_output_dir.mkdir(exist_ok=True)
         step_file = json_output_dir / f"{step}.json"
-        with open(step_file, 'w', encoding='utf-8') as f:
-            json.dump(data_dict, f, indent=2, ensure_ascii=False)
+        write_json_file(step_file, data_dict)
         
         # Auto-generate corresponding markdown file in plans/ directory
         try:
@@ -167,27 +181,30 @@ class ProjectStorage:
         """List all available projects"""
         projects = []
         
-        for project_dir in self.base_dir.iterdir():
-            if project_dir.is_dir() and not project_dir.name.startswith('.'):
-                metadata = self.load_metadata(project_dir.name)
-                available_steps = self.get_available_steps(project_dir.name)
-                
-                project_info = {
-                    "domain": project_dir.name,
-                    "path": str(project_dir),
-                    "available_steps": available_steps,
-                    "step_count": len(available_steps)
-                }
-                
-                if metadata:
-                    project_info.update({
-                        "created_at": metadata.created_at,
-                        "updated_at": metadata.updated_at,
-                        "last_step": metadata.last_step,
-                        "completed_steps": metadata.completed_steps
-                    })
-                
-                projects.append(project_info)
+        # Single scandir pass; DirEntry caches type info
+        with os.scandir(self.base_dir) as entries:
+            project_dirs = [entry for entry in entries if entry.is_dir() and not entry.name.startswith('.')]
+        
+        for project_dir in project_dirs:
+            metadata = self.load_metadata(project_dir.name)
+            available_steps = self.get_available_steps(project_dir.name)
+            
+            project_info = {
+                "domain": project_dir.name,
+                "path": project_dir.path,
+                "available_steps": available_steps,
+                "step_count": len(available_steps)
+            }
+            
+            if metadata:
+                project_info.update({
+                    "created_at": metadata.created_at,
+                    "updated_at": metadata.updated_at,
+                    "last_step": metadata.last_step,
+                    "completed_steps": metadata.completed_steps
+                })
+            
+            projects.append(project_info)
         
         # Sort by most recently updated
         projects.sort(key=lambda x: x.get("updated_at", datetime.min), reverse=True)
@@ -249,8 +266,7 @@ class ProjectStorage:
                     data["_stale_reason"] = f"Dependency '{changed_step}' was regenerated"
                     data["_stale_timestamp"] = datetime.now().isoformat()
                     
-                    with open(step_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    write_json_file(step_file, data)
                     
                     stale_steps.append(step)
                     logger.info(f"Marked {step} as stale due to {changed_step} regeneration")
@@ -331,5 +347,58 @@ class ProjectStorage:
             # Don't raise - this is a nice-to-have feature that shouldn't break JSON saving
 
 
+def write_json_file(path: Path, data: Dict[str, Any]) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when its output matches json.dump's"""
+    if ORJSON_AVAILABLE and _orjson_matches_json(data):
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _orjson_matches_json(value: Any) -> bool:
+    """Check that orjson encodes value byte for byte like json.dump(indent=2, ensure_ascii=False)"""
+    value_type = type(value)
+    if value_type is dict:
+        return all(type(key) is str and _orjson_matches_json(item) for key, item in value.items())
+    if value_type is list or value_type is tuple:
+        return all(_orjson_matches_json(item) for item in value)
+    if value_type is float:
+        # orjson writes NaN/Infinity as null and drops the exponent sign (1e16 vs 1e+16)
+        return math.isfinite(value) and "e" not in repr(value)
+    if value_type is int:
+        # orjson rejects integers wider than 64 bits
+        return -(1 << 63) <= value < (1 << 64)
+    # Anything else (datetime, UUID, dataclasses, ...) orjson would encode where json.dump raises
+    return value_type is str or value_type is bool or value is None
+
+
+def read_metadata_cached(metadata_file: Path, loader: Callable[[Path], Dict[str, Any]]) -> Dict[str, Any]:
+    """Load a metadata file through loader, reusing the last result while (mtime, size) is unchanged
+    
+    The returned dict is shared between callers and must not be mutated.
+    """
+    path = os.path.abspath(metadata_file)
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            _metadata_cache.move_to_end(path)
+            return cached[1]
+    
+    data = loader(metadata_file)
+    
+    with _metadata_cache_lock:
+        _metadata_cache[path] = (signature, data)
+        _metadata_cache.move_to_end(path)
+        while len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+    
+    return data
+
+
 # Global instance
 project_storage = ProjectStorage()
\ No newline at end of file
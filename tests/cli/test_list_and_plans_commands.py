@@ -5,39 +5,124 @@ Tests project listing and plan management functionality.
 
 import pytest
 import json
+import os
+import shutil
 from pathlib import Path
 from unittest.mock import patch, Mock
 from cli.main import app
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Pre-built overview.json bodies for setup loops; only the names vary
+_OVERVIEW_TMPL = '{{"company_name": "{name}", "_generated_at": "2024-01-01T00:00:00Z"}}'
+_INDUSTRY_OVERVIEW_TMPL = (
+    '{{"company_name": "{name}", "industry": "{industry}", '
+    '"_generated_at": "2024-01-01T00:00:00Z"}}'
+)
+
+# Placeholder overview.json for tests that only need the project to exist
+_STUB_OVERVIEW = b"{}"
+
+# ~75KB description, already encoded and free of characters JSON would escape
+_LARGE_DESCRIPTION = b"Large content. " * 5000
+
+
+def _write_large_overview(project_path: Path, name: str) -> None:
+    """Write an overview.json with a large description without going through json.dumps"""
+    (project_path / "overview.json").write_bytes(
+        b'{"company_name": "' + name.encode() + b'", "description": "' + _LARGE_DESCRIPTION
+        + b'", "_generated_at": "2024-01-01T00:00:00Z"}'
+    )
+
+
+@pytest.fixture
+def export_dir(tmp_path_factory):
+    """Scratch directory for export output, removed with the session's temp tree"""
+    return tmp_path_factory.mktemp("export")
+
+
+@pytest.fixture(scope="module")
+def prebuilt_multi_project(tmp_path_factory, _base_project, make_projects):
+    """Build one read-only project tree for the list flag tests; chdir here to use it"""
+    root = tmp_path_factory.mktemp("multi_project")
+    projects_dir = root / "gtm_projects"
+    projects_dir.mkdir()
+    shutil.copytree(_base_project, projects_dir / _base_project.name, copy_function=os.link)
+    make_projects(projects_dir, (
+        (domain, _STUB_OVERVIEW)
+        for domain in ["test1.com", "test2.com", "example.org", "recent.com", "zebra.com"]
+    ))
+    
+    # One project with only the overview step done
+    make_projects(projects_dir, [("incomplete.com", _STUB_OVERVIEW)])
+    (projects_dir / "incomplete.com" / ".metadata.json").write_bytes(_dumps({
+        "domain": "incomplete.com",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "steps_completed": ["overview"],
+        "version": "1.0"
+    }))
+    return root
+
+
+@pytest.fixture(scope="module")
+def fifty_projects(tmp_path_factory, make_projects):
+    """Build one tree of 50 small and 5 large (~75KB) projects; chdir here to use it"""
+    root = tmp_path_factory.mktemp("fifty")
+    projects_dir = root / "gtm_projects"
+    projects_dir.mkdir()
+    make_projects(projects_dir, (
+        (f"company{i:03d}.com", _OVERVIEW_TMPL.format(name=f"Company {i}").encode())
+        for i in range(50)
+    ))
+    for i in range(5):
+        project_path = projects_dir / f"large{i}.com"
+        project_path.mkdir()
+        _write_large_overview(project_path, f"Large Company {i}")
+    return root
+
+
+@pytest.fixture(scope="session")
+def list_help_result(app_warm):
+    """Render `list --help` once; the text depends only on the app definition"""
+    from typer.testing import CliRunner
+    return CliRunner().invoke(app_warm, ["list", "--help"])
+
 
 class TestListCommand:
     """Test suite for the list command"""
     
-    def test_list_help(self, mock_cli_runner):
+    def test_list_help(self, list_help_result):
         """Test list command help"""
-        result = mock_cli_runner.invoke(app, ["list", "--help"])
+        result = list_help_result
         
         assert result.exit_code == 0
         assert "list" in result.output.lower()
         assert "project" in result.output.lower()
     
-    def test_list_all_projects(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
+    def test_list_all_projects(self, mock_cli_runner, mock_project_with_data_ro, temp_project_dir, capsys):
         """Test listing all projects"""
         # Create additional project
         second_project = temp_project_dir / "second.com"
         second_project.mkdir()
-        (second_project / "overview.json").write_text(json.dumps({
+        (second_project / "overview.json").write_bytes(_dumps({
             "company_name": "Second Company",
             "_generated_at": "2024-01-01T00:00:00Z"
         }))
         
-        result = mock_cli_runner.invoke(app, ["list"])
+        exit_code = mock_cli_runner.invoke_fast(app, "list")
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "acme.com" in result.output
-        assert "second.com" in result.output
+        assert exit_code == 0
+        assert "acme.com" in output
+        assert "second.com" in output
     
-    def test_list_projects_with_details(self, mock_cli_runner, mock_project_with_data):
+    def test_list_projects_with_details(self, mock_cli_runner, mock_project_with_data_ro):
         """Test listing projects with detailed information"""
         result = mock_cli_runner.invoke(app, ["list", "--details"])
         
@@ -46,91 +131,59 @@ class TestListCommand:
         content_lower = result.output.lower()
         assert any(word in content_lower for word in ["complete", "progress", "generated", "steps"])
     
-    def test_list_projects_json_format(self, mock_cli_runner, mock_project_with_data):
+    def test_list_projects_json_format(self, mock_cli_runner, mock_project_with_data_ro):
         """Test listing projects in JSON format"""
         result = mock_cli_runner.invoke(app, ["list", "--json"])
         
         assert result.exit_code == 0
         assert "{" in result.output and "}" in result.output
     
-    def test_list_no_projects(self, mock_cli_runner, temp_project_dir):
+    def test_list_no_projects(self, mock_cli_runner, temp_project_dir, capsys):
         """Test list when no projects exist"""
-        result = mock_cli_runner.invoke(app, ["list"])
+        exit_code = mock_cli_runner.invoke_fast(app, "list")
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "no projects" in result.output.lower() or "empty" in result.output.lower()
+        assert exit_code == 0
+        assert "no projects" in output.lower() or "empty" in output.lower()
     
-    def test_list_projects_with_filter(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
-        """Test listing projects with domain filter"""
-        # Create additional projects
-        for domain in ["test1.com", "test2.com", "example.org"]:
-            project_path = temp_project_dir / domain
-            project_path.mkdir()
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"Company {domain}",
-                "_generated_at": "2024-01-01T00:00:00Z"
-            }))
+    def test_list_sort_date_follows_step_updates(self, mock_cli_runner, temp_project_dir, capsys):
+        """Test --sort date orders by the last step update, not by when the project was created"""
+        from cli.services.project_storage import ProjectStorage
         
-        result = mock_cli_runner.invoke(app, ["list", "--filter", "test"])
+        storage = ProjectStorage()
+        storage.save_step_data("zulu.com", "overview", {"company_name": "Zulu Corp"})
+        storage.save_step_data("alpha.com", "overview", {"company_name": "Alpha Corp"})
         
-        assert result.exit_code == 0
-        # Should filter to only test domains
-        assert "test1.com" in result.output or "test2.com" in result.output
-    
-    def test_list_projects_sort_by_date(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
-        """Test listing projects sorted by date"""
-        # Create project with different date
-        recent_project = temp_project_dir / "recent.com"
-        recent_project.mkdir()
-        (recent_project / "overview.json").write_text(json.dumps({
-            "company_name": "Recent Company",
-            "_generated_at": "2024-12-01T00:00:00Z"  # More recent
-        }))
+        # Rewriting an existing step file leaves zulu.com's directory mtime unchanged
+        storage.save_step_data("zulu.com", "overview", {"company_name": "Zulu Corp", "industry": "Logistics"})
         
-        result = mock_cli_runner.invoke(app, ["list", "--sort", "date"])
-        
-        assert result.exit_code == 0
-        # Should show projects in date order
-    
-    def test_list_projects_sort_by_name(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
-        """Test listing projects sorted by name"""
-        # Create project with different name
-        zebra_project = temp_project_dir / "zebra.com"
-        zebra_project.mkdir()
-        (zebra_project / "overview.json").write_text(json.dumps({
-            "company_name": "Zebra Company",
-            "_generated_at": "2024-01-01T00:00:00Z"
-        }))
+        exit_code = mock_cli_runner.invoke_fast(app, "list", sort="date")
+        output = capsys.readouterr().out
         
-        result = mock_cli_runner.invoke(app, ["list", "--sort", "name"])
-        
-        assert result.exit_code == 0
-        # Should show projects in alphabetical order
-    
-    def test_list_projects_with_status(self, mock_cli_runner, mock_project_with_data, mock_incomplete_project):
-        """Test listing projects showing completion status"""
-        result = mock_cli_runner.invoke(app, ["list", "--status"])
-        
-        assert result.exit_code == 0
-        # Should show completion status
-        content_lower = result.output.lower()
-        assert any(word in content_lower for word in ["complete", "incomplete", "progress", "%"])
+        assert exit_code == 0
+        assert output.index("zulu.com") < output.index("alpha.com")
     
-    def test_list_projects_limit(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
-        """Test listing projects with limit"""
-        # Create multiple projects
-        for i in range(5):
-            project_path = temp_project_dir / f"test{i}.com"
-            project_path.mkdir()
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"Test Company {i}",
-                "_generated_at": "2024-01-01T00:00:00Z"
-            }))
-        
-        result = mock_cli_runner.invoke(app, ["list", "--limit", "3"])
+    @pytest.mark.parametrize("flag,value,check", [
+        # Should filter to only test domains
+        ("--filter", "test", lambda output: "test1.com" in output or "test2.com" in output),
+        ("--sort", "date", lambda output: True),
+        ("--sort", "name", lambda output: output.index("acme.com") < output.index("zebra.com")),
+        ("--status", None, lambda output: any(
+            word in output.lower() for word in ["complete", "incomplete", "progress", "%"]
+        )),
+        # Exact limit behavior depends on implementation
+        ("--limit", "3", lambda output: True),
+    ], ids=["filter", "sort-date", "sort-name", "status", "limit"])
+    def test_list_flag_matrix(self, mock_cli_runner, prebuilt_multi_project, monkeypatch,
+                              flag, value, check):
+        """Test list with each filtering/sorting/status/limit flag against a shared project tree"""
+        monkeypatch.chdir(prebuilt_multi_project)
+        args = ["list", flag] if value is None else ["list", flag, value]
+        
+        result = mock_cli_runner.invoke(app, args)
         
         assert result.exit_code == 0
-        # Should limit results (exact behavior depends on implementation)
+        assert check(result.output)
 
 
 class TestPlansCommand:
@@ -143,16 +196,16 @@ class TestPlansCommand:
         assert result.exit_code == 0
         assert "plans" in result.output.lower()
     
-    def test_plans_list_all(self, mock_cli_runner, mock_project_with_data):
+    def test_plans_list_all(self, mock_cli_runner, mock_project_with_data_ro):
         """Test listing all strategic plans"""
         result = mock_cli_runner.invoke(app, ["plans", "list"])
         
         assert result.exit_code == 0
         # Should show available plans
     
-    def test_plans_show_specific_plan(self, mock_cli_runner, mock_project_with_data):
+    def test_plans_show_specific_plan(self, mock_cli_runner, mock_project_with_data_ro):
         """Test showing specific strategic plan"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["plans", "show", domain])
         
@@ -178,31 +231,24 @@ class TestPlansCommand:
         # Should either delete or ask for confirmation
         assert result.exit_code == 0 or "confirm" in result.output.lower()
     
-    def test_plans_export(self, mock_cli_runner, mock_project_with_data):
+    def test_plans_export(self, mock_cli_runner, mock_project_with_data_ro, export_dir):
         """Test exporting strategic plan"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
-        import tempfile
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = mock_cli_runner.invoke(app, [
-                "plans", "export", domain,
-                "--output", temp_dir
-            ])
-            
-            assert result.exit_code == 0
+        result = mock_cli_runner.invoke(app, [
+            "plans", "export", domain,
+            "--output", str(export_dir)
+        ])
+        
+        assert result.exit_code == 0
     
-    def test_plans_compare(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
+    def test_plans_compare(self, mock_cli_runner, mock_project_with_data_ro, temp_project_dir, make_projects):
         """Test comparing strategic plans"""
-        domain1 = mock_project_with_data.name
+        domain1 = mock_project_with_data_ro.name
         
         # Create second project
         domain2 = "second.com"
-        second_project = temp_project_dir / domain2
-        second_project.mkdir()
-        (second_project / "overview.json").write_text(json.dumps({
-            "company_name": "Second Company",
-            "_generated_at": "2024-01-01T00:00:00Z"
-        }))
+        make_projects(temp_project_dir, [(domain2, _STUB_OVERVIEW)])
         
         result = mock_cli_runner.invoke(app, ["plans", "compare", domain1, domain2])
         
@@ -227,9 +273,9 @@ class TestPlansCommand:
         
         assert result.exit_code == 0
     
-    def test_plans_validate(self, mock_cli_runner, mock_project_with_data):
+    def test_plans_validate(self, mock_cli_runner, mock_project_with_data_ro):
         """Test validating strategic plan"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["plans", "validate", domain])
         
@@ -262,63 +308,56 @@ class TestProjectManagementWorkflow:
         result = mock_cli_runner.invoke(app, ["plans", "list"])
         assert result.exit_code == 0
     
-    def test_project_filtering_and_search(self, mock_cli_runner, temp_project_dir):
+    def test_project_filtering_and_search(self, mock_cli_runner, temp_project_dir, make_projects):
         """Test project filtering and search capabilities"""
         # Create multiple projects
         domains = ["tech1.com", "tech2.com", "finance1.com", "finance2.com"]
+        company_types = ["tech" if "tech" in domain else "finance" for domain in domains]
         
-        for domain in domains:
-            project_path = temp_project_dir / domain
-            project_path.mkdir()
-            company_type = "tech" if "tech" in domain else "finance"
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"{company_type.title()} Company",
-                "industry": company_type,
-                "_generated_at": "2024-01-01T00:00:00Z"
-            }))
+        make_projects(temp_project_dir, (
+            (domain, _INDUSTRY_OVERVIEW_TMPL.format(
+                name=f"{company_type.title()} Company", industry=company_type
+            ).encode())
+            for domain, company_type in zip(domains, company_types)
+        ))
         
         # Test filtering
         result = mock_cli_runner.invoke(app, ["list", "--filter", "tech"])
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
         
         # Test search
         result = mock_cli_runner.invoke(app, ["list", "--search", "finance"])
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
     
-    def test_batch_operations(self, mock_cli_runner, temp_project_dir):
+    def test_batch_operations(self, mock_cli_runner, temp_project_dir, make_projects, export_dir):
         """Test batch operations on multiple projects"""
         # Create multiple projects
         domains = ["batch1.com", "batch2.com", "batch3.com"]
         
-        for domain in domains:
-            project_path = temp_project_dir / domain
-            project_path.mkdir()
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"Batch Company {domain}",
-                "_generated_at": "2024-01-01T00:00:00Z"
-            }))
+        make_projects(temp_project_dir, (
+            (domain, _STUB_OVERVIEW)
+            for domain in domains
+        ))
         
         # Test batch export
-        import tempfile
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = mock_cli_runner.invoke(app, [
-                "plans", "export", "--all",
-                "--output", temp_dir
-            ])
-            assert result.exit_code == 0 or "not implemented" in result.output.lower()
+        result = mock_cli_runner.invoke(app, [
+            "plans", "export", "--all",
+            "--output", str(export_dir)
+        ])
+        assert result.exit_code == 0 or "not implemented" in result.output.lower()
 
 
 class TestListAndPlansEdgeCases:
     """Test edge cases for list and plans commands"""
     
-    def test_list_corrupted_projects(self, mock_cli_runner, mock_corrupted_project):
+    def test_list_corrupted_projects(self, invoke_silent, mock_corrupted_project):
         """Test list with corrupted project data"""
-        result = mock_cli_runner.invoke(app, ["list"])
+        exit_code = invoke_silent(app, ["list"])
         
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Should handle corrupted projects gracefully
     
-    def test_list_projects_with_special_characters(self, mock_cli_runner, temp_project_dir):
+    def test_list_projects_with_special_characters(self, invoke_silent, temp_project_dir):
         """Test list with projects containing special characters"""
         # Create project with special characters
         domain = "spëcial-tëst.com"
@@ -329,27 +368,59 @@ class TestListAndPlansEdgeCases:
             "_generated_at": "2024-01-01T00:00:00Z"
         }, ensure_ascii=False))
         
-        result = mock_cli_runner.invoke(app, ["list"])
+        exit_code = invoke_silent(app, ["list"])
         
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Should handle special characters properly
     
-    def test_list_very_large_number_of_projects(self, mock_cli_runner, temp_project_dir):
+    def test_list_very_large_number_of_projects(self, invoke_silent, fifty_projects, monkeypatch):
         """Test list with many projects"""
-        # Create many projects
-        for i in range(50):
-            project_path = temp_project_dir / f"company{i:03d}.com"
-            project_path.mkdir()
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"Company {i}",
-                "_generated_at": "2024-01-01T00:00:00Z"
-            }))
+        monkeypatch.chdir(fifty_projects)
         
-        result = mock_cli_runner.invoke(app, ["list"])
+        exit_code = invoke_silent(app, ["list"])
         
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Should handle large number of projects
     
+    def test_list_reads_storage_metadata(self, mock_cli_runner, temp_project_dir, capsys):
+        """Test list reads the completed steps ProjectStorage persists"""
+        from cli.commands.list_projects import read_project_header
+        from cli.services.project_storage import ProjectStorage
+        
+        storage = ProjectStorage()
+        storage.save_step_data("stored.com", "overview", {"company_name": "Stored Corp"})
+        storage.save_step_data("stored.com", "account", {"target_account_name": "Stored Accounts"})
+        
+        header = read_project_header(temp_project_dir / "stored.com" / ".metadata.json")
+        assert header == {
+            "completed_steps": ["overview", "account"],
+            "updated_at": str(storage.load_metadata("stored.com").updated_at),
+        }
+        
+        exit_code = mock_cli_runner.invoke_fast(app, "list")
+        output = capsys.readouterr().out
+        
+        assert exit_code == 0
+        assert "Partial (2/5)" in output
+    
+    def test_list_reads_project_manager_metadata(self, tmp_path):
+        """Test list also reads the steps_completed/modified_at keys ProjectManager writes"""
+        from cli.commands.list_projects import read_project_header
+        
+        metadata_file = tmp_path / ".metadata.json"
+        metadata_file.write_bytes(_dumps({
+            "domain": "legacy.com",
+            "created_at": "2024-01-01T00:00:00",
+            "modified_at": "2024-01-02T00:00:00",
+            "steps_completed": ["overview"],
+            "total_steps": 5
+        }))
+        
+        assert read_project_header(metadata_file) == {
+            "completed_steps": ["overview"],
+            "updated_at": "2024-01-02T00:00:00",
+        }
+    
     def test_plans_with_missing_dependencies(self, mock_cli_runner, mock_incomplete_project):
         """Test plans command with incomplete project data"""
         domain = mock_incomplete_project.name
@@ -359,9 +430,9 @@ class TestListAndPlansEdgeCases:
         # Should either work with available data or request missing information
         assert result.exit_code == 0 or "missing" in result.output.lower()
     
-    def test_plans_permission_errors(self, mock_cli_runner, mock_project_with_data):
+    def test_plans_permission_errors(self, mock_cli_runner, mock_project_with_data_ro):
         """Test plans command with file permission issues"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         # Try to export to protected location
         result = mock_cli_runner.invoke(app, [
@@ -372,13 +443,13 @@ class TestListAndPlansEdgeCases:
         # Should handle permission errors gracefully
         assert result.exit_code != 0 or "permission" in result.output.lower()
     
-    def test_list_and_plans_consistency(self, mock_cli_runner, mock_project_with_data):
+    def test_list_and_plans_consistency(self, invoke_silent, mock_cli_runner, mock_project_with_data_ro):
         """Test consistency between list and plans commands"""
         # List should show projects that plans can work with
-        list_result = mock_cli_runner.invoke(app, ["list"])
+        list_exit_code = invoke_silent(app, ["list"])
         plans_result = mock_cli_runner.invoke(app, ["plans", "list"])
         
-        assert list_result.exit_code == 0
+        assert list_exit_code == 0
         assert plans_result.exit_code == 0
         
         # Both should reference the same projects
@@ -387,25 +458,22 @@ class TestListAndPlansEdgeCases:
 class TestListAndPlansPerformance:
     """Test performance of list and plans commands"""
     
-    def test_list_performance_many_projects(self, mock_cli_runner, temp_project_dir):
+    def test_list_performance_many_projects(self, benchmark, mock_cli_runner, temp_project_dir,
+                                            make_projects):
         """Test list performance with many projects"""
-        import time
-        
         # Create moderate number of projects
-        for i in range(20):
-            project_path = temp_project_dir / f"perf{i:03d}.com"
-            project_path.mkdir()
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"Performance Test {i}",
-                "_generated_at": "2024-01-01T00:00:00Z"
-            }))
+        make_projects(temp_project_dir, (
+            (f"perf{i:03d}.com", _STUB_OVERVIEW)
+            for i in range(20)
+        ))
         
-        start_time = time.time()
-        result = mock_cli_runner.invoke(app, ["list"])
-        elapsed_time = time.time() - start_time
+        result = benchmark.pedantic(mock_cli_runner.invoke, args=(app, ["list"]),
+                                    rounds=5, warmup_rounds=1)
         
         assert result.exit_code == 0
-        assert elapsed_time < 5.0  # Should be fast
+        # Timings are not collected when benchmarking is disabled (e.g. under xdist)
+        if not benchmark.disabled:
+            assert benchmark.stats["median"] < 2.0
     
     def test_plans_generation_performance(self, mock_cli_runner, mock_project_with_data):
         """Test plans generation performance"""
@@ -420,20 +488,12 @@ class TestListAndPlansPerformance:
         assert result.exit_code == 0
         assert elapsed_time < 15.0  # Should complete reasonably quickly
     
-    def test_list_memory_usage(self, mock_cli_runner, temp_project_dir):
+    def test_list_memory_usage(self, mock_cli_runner, fifty_projects, monkeypatch):
         """Test list command memory usage with large projects"""
-        # Create projects with large data
-        for i in range(5):
-            project_path = temp_project_dir / f"large{i}.com"
-            project_path.mkdir()
-            large_description = "Large content. " * 5000  # ~65KB each
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"Large Company {i}",
-                "description": large_description,
-                "_generated_at": "2024-01-01T00:00:00Z"
-            }))
+        # The shared tree includes projects with large data
+        monkeypatch.chdir(fifty_projects)
         
         result = mock_cli_runner.invoke(app, ["list", "--details"])
         
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
         # Should handle large projects without memory issues
\ No newline at end of file
@@ -4,28 +4,55 @@ Tests the remaining CLI commands with mocked dependencies.
 """
 
 import pytest
-import json
+import os
 from pathlib import Path
 from unittest.mock import patch, Mock
+from rich.console import Console
 from typer.testing import CliRunner
 
 from cli.main import app
 
+# Pre-serialized overview.json bodies for tests that only need a company name
+_MINIMAL_OVERVIEW = b'{"company_name": "Minimal Corp"}'
+_SECOND_OVERVIEW = b'{"company_name": "Second Company"}'
+_TEST_OVERVIEW = b'{"company_name": "Test"}'
+_COMPANY_OVERVIEW = b'{"company_name": "Company"}'
+
+
+@pytest.fixture(autouse=True)
+def _fast_console(monkeypatch):
+    """Swap cli.main's console for a plain one: no color, markup or highlighting
+    
+    Assertions here only match substrings, so Rich's markup parsing and
+    highlighting is wasted work. file is left unset so output still goes to
+    whatever sys.stdout CliRunner has installed.
+    """
+    import cli.main
+    monkeypatch.setattr(cli.main, "console", Console(
+        color_system=None, width=200, highlight=False, markup=False, legacy_windows=False,
+    ))
+
+
+@pytest.fixture
+def suppress_write(monkeypatch):
+    """Record Path.write_text calls instead of writing; returns the list of (path, data)"""
+    calls = []
+    monkeypatch.setattr(Path, "write_text", lambda self, data, *args, **kwargs: calls.append((self, data)))
+    return calls
+
+
+@pytest.fixture
+def unreadable_project(mock_project_with_data):
+    """Make the mock project directory inaccessible, restoring it for cleanup"""
+    mock_project_with_data.chmod(0o000)
+    yield mock_project_with_data
+    mock_project_with_data.chmod(0o755)
+
 
 class TestEditCommand:
     """Test suite for the edit command"""
     
-    def test_edit_strategy_with_domain(self, mock_cli_runner, mock_project_with_data):
-        """Test editing strategy for specific domain"""
-        domain = mock_project_with_data.name
-        
-        with patch('cli.utils.editor.open_file_in_editor') as mock_editor:
-            result = mock_cli_runner.invoke(app, ["edit", "strategy", "--domain", domain])
-            
-            assert result.exit_code == 0
-            assert mock_editor.called
-    
-    def test_edit_overview_auto_detect(self, mock_cli_runner, mock_project_with_data):
+    def test_edit_overview_auto_detect(self, mock_cli_runner, mock_project_with_data_ro):
         """Test editing overview with auto-detected domain"""
         with patch('cli.utils.editor.open_file_in_editor') as mock_editor:
             result = mock_cli_runner.invoke(app, ["edit", "overview"])
@@ -41,9 +68,9 @@ class TestEditCommand:
         # Should show error or guidance message
         assert "not found" in result.output.lower() or "no gtm project" in result.output.lower()
     
-    def test_edit_invalid_step(self, mock_cli_runner, mock_project_with_data):
+    def test_edit_invalid_step(self, mock_cli_runner, mock_project_with_data_ro):
         """Test editing invalid step"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["edit", "invalid_step", "--domain", domain])
         
@@ -57,8 +84,7 @@ class TestEditCommand:
         project_path = temp_project_dir / domain
         project_path.mkdir()
         
-        overview_data = {"company_name": "Minimal Corp"}
-        (project_path / "overview.json").write_text(json.dumps(overview_data))
+        (project_path / "overview.json").write_bytes(_MINIMAL_OVERVIEW)
         
         with patch('cli.utils.editor.open_file_in_editor') as mock_editor:
             result = mock_cli_runner.invoke(app, ["edit", "overview", "--domain", domain])
@@ -66,23 +92,21 @@ class TestEditCommand:
             # Should handle missing markdown files gracefully
             assert result.exit_code == 0
     
-    def test_edit_multiple_projects_no_domain(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
+    def test_edit_multiple_projects_no_domain(self, mock_cli_runner, mock_project_with_data_ro, temp_project_dir):
         """Test editing when multiple projects exist without domain"""
         # Create second project
         second_project = temp_project_dir / "second.com"
         second_project.mkdir()
-        (second_project / "overview.json").write_text(json.dumps({
-            "company_name": "Second Company"
-        }))
+        (second_project / "overview.json").write_bytes(_SECOND_OVERVIEW)
         
         result = mock_cli_runner.invoke(app, ["edit", "strategy"])
         
         # Should require domain specification or auto-detect
         assert result.exit_code in [0, 1]
     
-    def test_edit_editor_detection(self, mock_cli_runner, mock_project_with_data):
+    def test_edit_editor_detection(self, mock_cli_runner, mock_project_with_data_ro):
         """Test editor detection and usage"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         with patch('cli.utils.editor.detect_editor', return_value='code') as mock_detect, \
              patch('cli.utils.editor.open_file_in_editor') as mock_open:
@@ -105,28 +129,20 @@ class TestExportCommand:
         assert result.exit_code == 0
         assert "Exporting GTM assets" in result.output
     
-    def test_export_single_asset(self, mock_cli_runner, mock_project_with_data):
-        """Test exporting single asset"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["export", "overview", "--domain", domain])
-        
-        assert result.exit_code == 0
-    
-    def test_export_with_custom_output(self, mock_cli_runner, mock_project_with_data, tmp_path):
+    def test_export_with_custom_output(self, mock_cli_runner, mock_project_with_data, tmp_path,
+                                       suppress_write):
         """Test exporting with custom output path"""
         domain = mock_project_with_data.name
         output_file = tmp_path / "custom_export.md"
         
-        with patch('pathlib.Path.write_text') as mock_write:
-            result = mock_cli_runner.invoke(app, [
-                "export", "overview", 
-                "--domain", domain,
-                "--output", str(output_file)
-            ])
-            
-            assert result.exit_code == 0
-            assert mock_write.called
+        result = mock_cli_runner.invoke(app, [
+            "export", "overview", 
+            "--domain", domain,
+            "--output", str(output_file)
+        ])
+        
+        assert result.exit_code == 0
+        assert len(suppress_write) > 0
     
     def test_export_nonexistent_project(self, mock_cli_runner):
         """Test exporting non-existent project"""
@@ -146,9 +162,7 @@ class TestExportCommand:
         # Create second project
         second_project = temp_project_dir / "second.com"
         second_project.mkdir()
-        (second_project / "overview.json").write_text(json.dumps({
-            "company_name": "Second Company"
-        }))
+        (second_project / "overview.json").write_bytes(_SECOND_OVERVIEW)
         
         result = mock_cli_runner.invoke(app, ["export", "all"])
         
@@ -166,66 +180,60 @@ class TestExportCommand:
         assert "Unknown asset" in result.output
         assert "Available assets:" in result.output
     
-    def test_export_creates_output_file(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
+    def test_export_creates_output_file(self, mock_cli_runner, mock_project_with_data, temp_project_dir,
+                                        suppress_write):
         """Test that export creates output file"""
         domain = mock_project_with_data.name
         
-        with patch('pathlib.Path.write_text') as mock_write:
-            result = mock_cli_runner.invoke(app, ["export", "overview", "--domain", domain])
-            
-            assert result.exit_code == 0
-            # Should attempt to write file
-            if mock_write.called:
-                assert len(mock_write.call_args[0]) > 0  # Content should not be empty
+        result = mock_cli_runner.invoke(app, ["export", "overview", "--domain", domain])
+        
+        assert result.exit_code == 0
+        # Should attempt to write file
+        if suppress_write:
+            assert len(suppress_write[-1][1]) > 0  # Content should not be empty
     
-    def test_export_default_filename_format(self, mock_cli_runner, mock_project_with_data):
+    def test_export_default_filename_format(self, mock_cli_runner, mock_project_with_data, suppress_write):
         """Test default filename format"""
         domain = mock_project_with_data.name
         
-        with patch('pathlib.Path.write_text') as mock_write:
-            result = mock_cli_runner.invoke(app, ["export", "overview", "--domain", domain])
-            
-            assert result.exit_code == 0
-            # Test passes if export functionality works (filename tested in integration)
+        result = mock_cli_runner.invoke(app, ["export", "overview", "--domain", domain])
+        
+        assert result.exit_code == 0
+        # Test passes if export functionality works (filename tested in integration)
 
 
 class TestListCommand:
     """Test suite for the list command"""
     
-    def test_list_all_projects(self, mock_cli_runner, mock_project_with_data, mock_incomplete_project):
+    def test_list_all_projects(self, mock_cli_runner, mock_project_with_data_ro, mock_incomplete_project):
         """Test listing all projects"""
         result = mock_cli_runner.invoke(app, ["list"])
         
         assert result.exit_code == 0
-        assert "GTM projects" in result.output.lower() or mock_project_with_data.name in result.output
+        assert "GTM projects" in result.output.lower() or mock_project_with_data_ro.name in result.output
     
-    def test_list_specific_domain(self, mock_cli_runner, mock_project_with_data):
-        """Test listing files for specific domain"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["list", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert domain in result.output
-    
-    def test_list_no_projects(self, mock_cli_runner, temp_project_dir):
+    def test_list_no_projects(self, mock_cli_runner, monkeypatch):
         """Test listing when no projects exist"""
-        # temp_project_dir is empty
+        monkeypatch.setattr("cli.commands.list_projects.find_project_dirs", lambda base: [])
         result = mock_cli_runner.invoke(app, ["list"])
         
         assert result.exit_code == 0
         assert "No GTM projects found" in result.output or "no projects" in result.output.lower()
     
-    def test_list_nonexistent_domain(self, mock_cli_runner):
+    def test_list_nonexistent_domain(self, mock_cli_runner, monkeypatch):
         """Test listing non-existent domain"""
+        other_project = Mock(path="gtm_projects/other.com")
+        other_project.name = "other.com"
+        monkeypatch.setattr("cli.commands.list_projects.find_project_dirs", lambda base: [other_project])
         result = mock_cli_runner.invoke(app, ["list", "--domain", "nonexistent.com"])
         
         assert result.exit_code == 0
         # Should show no files or appropriate message
+        assert "No project found" in result.output
     
-    def test_list_shows_file_structure(self, mock_cli_runner, mock_project_with_data):
+    def test_list_shows_file_structure(self, mock_cli_runner, mock_project_with_data_ro):
         """Test that list shows file structure"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["list", "--domain", domain])
         
@@ -233,7 +241,7 @@ class TestListCommand:
         # Should show some indication of files/structure
         assert ".json" in result.output or "files" in result.output.lower()
     
-    def test_list_with_metadata(self, mock_cli_runner, mock_project_with_data):
+    def test_list_with_metadata(self, mock_cli_runner, mock_project_with_data_ro):
         """Test list command includes metadata"""
         result = mock_cli_runner.invoke(app, ["list"])
         
@@ -245,118 +253,145 @@ class TestListCommand:
 class TestMainAppIntegration:
     """Test main app integration and global options"""
     
-    def test_version_option(self, mock_cli_runner):
+    def test_version_option(self, invoke_recorded):
         """Test --version option"""
-        result = mock_cli_runner.invoke(app, ["--version"])
+        result = invoke_recorded(["--version"])
         
         assert result.exit_code == 0
         assert "Blossomer GTM CLI" in result.output
         assert "version" in result.output.lower()
     
-    def test_help_option(self, mock_cli_runner):
+    def test_help_option(self, invoke_recorded):
         """Test --help option"""
-        result = mock_cli_runner.invoke(app, ["--help"])
+        result = invoke_recorded(["--help"])
         
         assert result.exit_code == 0
         assert "Blossomer GTM CLI" in result.output
         assert "init" in result.output
         assert "show" in result.output
     
-    def test_verbose_option(self, mock_cli_runner, mock_project_with_data):
+    def test_verbose_option(self, mock_cli_runner, mock_project_with_data_ro):
         """Test --verbose option"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["--verbose", "show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         # Verbose mode should work (may not show different output in mocked environment)
     
-    def test_quiet_option(self, mock_cli_runner, mock_project_with_data):
+    def test_quiet_option(self, mock_cli_runner, mock_project_with_data_ro):
         """Test --quiet option"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["--quiet", "show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         # Quiet mode should work
     
-    def test_no_color_option(self, mock_cli_runner, mock_project_with_data):
+    def test_no_color_option(self, mock_cli_runner, mock_project_with_data_ro):
         """Test --no-color option"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["--no-color", "show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         # No-color mode should work
     
-    def test_debug_option(self, mock_cli_runner, mock_project_with_data):
+    @pytest.mark.parametrize("no_color_env,color_disabled", [
+        ("1", True),
+        ("", False),
+    ], ids=["set", "empty"])
+    def test_no_color_env_var(self, mock_cli_runner, monkeypatch, no_color_env, color_disabled):
+        """Test NO_COLOR disables color unless it is empty (no-color.org treats empty as unset)"""
+        import cli.main
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.setattr(cli.main, "console", Console(color_system="truecolor"))
+        
+        result = mock_cli_runner.invoke(app, [], env={"NO_COLOR": no_color_env})
+        
+        assert result.exit_code == 0
+        assert (cli.main.console.color_system is None) == color_disabled
+    
+    def test_debug_option(self, mock_cli_runner, mock_project_with_data_ro):
         """Test --debug option"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["--debug", "show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         # Debug mode should work
     
-    def test_main_welcome_panel(self, mock_cli_runner):
+    def test_main_welcome_panel(self, invoke_recorded):
         """Test main welcome panel when no command is given"""
-        result = mock_cli_runner.invoke(app, [])
+        result = invoke_recorded([])
         
         assert result.exit_code == 0
         assert "Welcome to" in result.output
         assert "Blossomer CLI" in result.output
         assert "Available Commands" in result.output
     
-    def test_invalid_command(self, mock_cli_runner):
+    def test_invalid_command(self, invoke_recorded):
         """Test invalid command handling"""
-        result = mock_cli_runner.invoke(app, ["invalid_command"])
+        result = invoke_recorded(["invalid_command"])
         
         # Should show error or help
         assert result.exit_code != 0 or "No such command" in result.output
 
 
+class TestDomainOption:
+    """Test --domain on an existing project across commands"""
+    
+    @pytest.mark.parametrize("cmd,opens_editor,echoes_domain", [
+        (["edit", "strategy"], True, False),
+        (["export", "overview"], False, False),
+        (["list"], False, True),
+    ], ids=["edit", "export", "list"])
+    def test_domain_happy_path(self, mock_cli_runner, mock_project_with_data, cmd, opens_editor, echoes_domain):
+        """Test commands succeed for a specific existing domain"""
+        domain = mock_project_with_data.name
+        
+        with patch('cli.utils.editor.open_file_in_editor') as mock_editor:
+            result = mock_cli_runner.invoke(app, [*cmd, "--domain", domain])
+        
+        assert result.exit_code == 0
+        if opens_editor:
+            assert mock_editor.called
+        if echoes_domain:
+            assert domain in result.output
+
+
 class TestCommandErrorHandling:
     """Test error handling across all commands"""
     
-    def test_commands_handle_permission_errors(self, mock_cli_runner, mock_project_with_data):
+    @pytest.mark.parametrize("cmd", [
+        ["show", "all"],
+        ["edit", "strategy"],
+        ["export", "overview"],
+        ["list"],
+    ], ids=["show", "edit", "export", "list"])
+    def test_commands_handle_permission_errors(self, mock_cli_runner, unreadable_project, cmd):
         """Test commands handle file permission errors"""
-        domain = mock_project_with_data.name
+        domain = unreadable_project.name
         
-        # Make project directory inaccessible
-        mock_project_with_data.chmod(0o000)
+        result = mock_cli_runner.invoke(app, [*cmd, "--domain", domain])
         
-        try:
-            commands_to_test = [
-                ["show", "all", "--domain", domain],
-                ["edit", "strategy", "--domain", domain],
-                ["export", "overview", "--domain", domain],
-                ["list", "--domain", domain]
-            ]
-            
-            for cmd in commands_to_test:
-                result = mock_cli_runner.invoke(app, cmd)
-                # Should handle errors gracefully (not crash)
-                assert result.exit_code in [0, 1]
-                
-        finally:
-            # Restore permissions for cleanup
-            mock_project_with_data.chmod(0o755)
-    
-    def test_commands_handle_corrupted_data(self, mock_cli_runner, mock_corrupted_project):
+        # Should handle errors gracefully (not crash)
+        assert result.exit_code in [0, 1]
+    
+    @pytest.mark.parametrize("cmd", [
+        ["show", "overview"],
+        ["edit", "overview"],
+        ["export", "overview"],
+        ["list"],
+    ], ids=["show", "edit", "export", "list"])
+    def test_commands_handle_corrupted_data(self, mock_cli_runner, mock_corrupted_project, cmd):
         """Test commands handle corrupted project data"""
         domain = mock_corrupted_project.name
         
-        commands_to_test = [
-            ["show", "overview", "--domain", domain],
-            ["edit", "overview", "--domain", domain],
-            ["export", "overview", "--domain", domain],
-            ["list", "--domain", domain]
-        ]
+        result = mock_cli_runner.invoke(app, [*cmd, "--domain", domain])
         
-        for cmd in commands_to_test:
-            result = mock_cli_runner.invoke(app, cmd)
-            # Should handle corrupted data gracefully
-            assert result.exit_code in [0, 1]
+        # Should handle corrupted data gracefully
+        assert result.exit_code in [0, 1]
     
     def test_commands_handle_missing_dependencies(self, mock_cli_runner, temp_project_dir):
         """Test commands handle missing system dependencies"""
@@ -364,7 +399,7 @@ class TestCommandErrorHandling:
         domain = "deps-test.com"
         project_path = temp_project_dir / domain
         project_path.mkdir()
-        (project_path / "overview.json").write_text(json.dumps({"company_name": "Test"}))
+        (project_path / "overview.json").write_bytes(_TEST_OVERVIEW)
         
         # Mock missing editor
         with patch('cli.utils.editor.detect_editor', return_value=None):
@@ -373,49 +408,52 @@ class TestCommandErrorHandling:
             # Should handle missing editor gracefully
             assert result.exit_code in [0, 1]
     
-    def test_commands_handle_disk_space_error(self, mock_cli_runner, mock_project_with_data):
+    def test_commands_handle_disk_space_error(self, mock_cli_runner, mock_project_with_data, monkeypatch):
         """Test commands handle disk space errors"""
         domain = mock_project_with_data.name
         
         # Mock disk space error
-        with patch('pathlib.Path.write_text', side_effect=OSError("No space left on device")):
-            result = mock_cli_runner.invoke(app, ["export", "overview", "--domain", domain])
-            
-            # Should handle disk space error gracefully
-            assert result.exit_code in [0, 1]
-            if result.exit_code == 1:
-                assert "error" in result.output.lower() or "failed" in result.output.lower()
+        def disk_full(self, data, *args, **kwargs):
+            raise OSError("No space left on device")
+        
+        monkeypatch.setattr(Path, "write_text", disk_full)
+        result = mock_cli_runner.invoke(app, ["export", "overview", "--domain", domain])
+        
+        # Should handle disk space error gracefully
+        assert result.exit_code in [0, 1]
+        if result.exit_code == 1:
+            assert "error" in result.output.lower() or "failed" in result.output.lower()
 
 
 class TestCommandPerformance:
     """Test performance characteristics of commands"""
     
-    def test_show_command_performance(self, mock_cli_runner, mock_project_with_data):
+    def test_show_command_performance(self, mock_cli_runner, mock_project_with_data_ro):
         """Test show command completes quickly"""
         import time
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = mock_cli_runner.invoke(app, ["show", "all", "--domain", domain])
-        elapsed_time = time.time() - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         assert result.exit_code == 0
-        assert elapsed_time < 5.0  # Should complete within 5 seconds
+        assert elapsed_ns < 500_000_000  # Should complete within 0.5 seconds
     
     def test_list_command_with_many_projects(self, mock_cli_runner, temp_project_dir):
         """Test list command performance with many projects"""
-        # Create multiple projects
+        # Create multiple projects sharing one overview.json through hardlinks
+        template = temp_project_dir.parent / "overview-template.json"
+        template.write_bytes(_COMPANY_OVERVIEW)
         for i in range(20):
             project_path = temp_project_dir / f"project-{i}.com"
             project_path.mkdir()
-            (project_path / "overview.json").write_text(json.dumps({
-                "company_name": f"Company {i}"
-            }))
+            os.link(template, project_path / "overview.json")
         
         import time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = mock_cli_runner.invoke(app, ["list"])
-        elapsed_time = time.time() - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         assert result.exit_code == 0
-        assert elapsed_time < 3.0  # Should handle many projects quickly
\ No newline at end of file
+        assert elapsed_ns < 1_000_000_000  # Should handle many projects within 1 second
\ No newline at end of file
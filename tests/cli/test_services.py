@@ -5,28 +5,70 @@ Tests the core service layer without making real API calls.
 
 import pytest
 import json
+import re
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 
-# Import the services to test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
+# Import the services to test (tests/conftest.py puts the repo root on sys.path)
 from cli.services.gtm_generation_service import GTMGenerationService
-from cli.services.project_storage import ProjectStorage
+from cli.services.project_storage import ProjectStorage, read_metadata_cached, write_json_file
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    # json.loads accepts bytes too
+    _loads = json.loads
+
+# Dependency errors raised by GTMGenerationService
+_NO_OVERVIEW_ERROR = re.compile(r"Company overview must be generated first")
+_NO_ACCOUNT_ERROR = re.compile(r"Target account must be generated first")
+
+# Pre-serialized overview.json for tests that only need the step to exist
+_TEST_CORP_OVERVIEW = b'{"company_name": "Test Corp", "_generated_at": "2024-01-01T00:00:00Z"}'
+
+# 10KB payload shared by the performance tests
+_LARGE_FIELD = "x" * 10000
+
+
+@pytest.fixture(scope="module")
+def storage_root(tmp_path_factory):
+    """One temp directory for the module; storage tests get subdirectories of it"""
+    return tmp_path_factory.mktemp("storage")
+
+
+@pytest.fixture
+def storage(storage_root, request):
+    """Create project storage instance in a per-test subdirectory"""
+    return ProjectStorage(str(storage_root / request.node.name))
+
+
+@pytest.fixture(scope="module")
+def _gtm_service_instance():
+    """Build the GTM service once; it holds no per-test state besides storage"""
+    return GTMGenerationService()
+
+
+@pytest.fixture
+def gtm_service(_gtm_service_instance, temp_project_dir):
+    """GTM service whose storage resolves into the test's temp project dir"""
+    # temp_project_dir chdirs, so the relative "gtm_projects" storage lands there
+    return _gtm_service_instance
+
+
+def _assert_generated(result, attr, storage, domain, step):
+    """Assert a generation step returned a model with attr and saved its data; returns the saved data"""
+    assert result is not None
+    assert hasattr(result, attr)
+    saved_data = storage.load_step_data(domain, step)
+    assert saved_data is not None
+    return saved_data
 
 
 class TestGTMGenerationService:
     """Test suite for GTM Generation Service"""
     
-    @pytest.fixture
-    def gtm_service(self, temp_project_dir):
-        """Create GTM service instance with temp storage"""
-        service = GTMGenerationService()
-        service.storage.PROJECT_ROOT = temp_project_dir
-        return service
-    
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_company_overview_new(self, gtm_service, mock_llm_responses):
         """Test generating new company overview"""
         domain = "acme.com"
@@ -38,14 +80,11 @@ class TestGTMGenerationService:
             force_regenerate=True
         )
         
-        assert result is not None
-        assert hasattr(result, 'company_name')
         # Verify it was saved to storage
-        saved_data = gtm_service.storage.load_step_data(domain, "overview")
-        assert saved_data is not None
+        saved_data = _assert_generated(result, 'company_name', gtm_service.storage, domain, "overview")
         assert saved_data['company_name'] == mock_llm_responses['overview']['company_name']
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_company_overview_existing(self, gtm_service, mock_project_with_data):
         """Test loading existing company overview"""
         domain = mock_project_with_data.name
@@ -59,7 +98,7 @@ class TestGTMGenerationService:
         assert result is not None
         assert result.company_name == "Acme Corporation"  # From mock data
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_target_account_new(self, gtm_service, mock_project_with_data, mock_llm_responses):
         """Test generating new target account"""
         domain = mock_project_with_data.name
@@ -71,24 +110,21 @@ class TestGTMGenerationService:
             force_regenerate=True
         )
         
-        assert result is not None
-        assert hasattr(result, 'target_account_name')
         # Verify it was saved
-        saved_data = gtm_service.storage.load_step_data(domain, "account")
-        assert saved_data is not None
+        _assert_generated(result, 'target_account_name', gtm_service.storage, domain, "account")
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_target_account_missing_dependency(self, gtm_service, temp_project_dir):
         """Test target account generation with missing company overview"""
         domain = "no-overview.com"
         
-        with pytest.raises(ValueError, match="Company overview must be generated first"):
+        with pytest.raises(ValueError, match=_NO_OVERVIEW_ERROR):
             await gtm_service.generate_target_account(
                 domain=domain,
                 force_regenerate=True
             )
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_target_persona_new(self, gtm_service, mock_project_with_data, mock_llm_responses):
         """Test generating new target persona"""
         domain = mock_project_with_data.name
@@ -100,13 +136,10 @@ class TestGTMGenerationService:
             force_regenerate=True
         )
         
-        assert result is not None
-        assert hasattr(result, 'target_persona_name')
         # Verify it was saved
-        saved_data = gtm_service.storage.load_step_data(domain, "persona")
-        assert saved_data is not None
+        _assert_generated(result, 'target_persona_name', gtm_service.storage, domain, "persona")
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_target_persona_missing_dependencies(self, gtm_service, temp_project_dir):
         """Test persona generation with missing dependencies"""
         domain = "incomplete.com"
@@ -114,16 +147,15 @@ class TestGTMGenerationService:
         # Create only overview (missing account)
         project_path = temp_project_dir / domain
         project_path.mkdir()
-        overview_data = {"company_name": "Test Corp", "_generated_at": "2024-01-01T00:00:00Z"}
-        (project_path / "overview.json").write_text(json.dumps(overview_data))
+        (project_path / "overview.json").write_bytes(_TEST_CORP_OVERVIEW)
         
-        with pytest.raises(ValueError, match="Target account must be generated first"):
+        with pytest.raises(ValueError, match=_NO_ACCOUNT_ERROR):
             await gtm_service.generate_target_persona(
                 domain=domain,
                 force_regenerate=True
             )
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_email_campaign_new(self, gtm_service, mock_project_with_data, mock_llm_responses):
         """Test generating new email campaign"""
         domain = mock_project_with_data.name
@@ -133,13 +165,10 @@ class TestGTMGenerationService:
             force_regenerate=True
         )
         
-        assert result is not None
-        assert hasattr(result, 'subjects')
         # Verify it was saved
-        saved_data = gtm_service.storage.load_step_data(domain, "email")
-        assert saved_data is not None
+        _assert_generated(result, 'subjects', gtm_service.storage, domain, "email")
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_email_campaign_with_preferences(self, gtm_service, mock_project_with_data):
         """Test generating email campaign with guided preferences"""
         domain = mock_project_with_data.name
@@ -157,9 +186,9 @@ class TestGTMGenerationService:
         
         assert result is not None
     
-    def test_get_project_status_existing(self, gtm_service, mock_project_with_data):
+    def test_get_project_status_existing(self, gtm_service, mock_project_with_data_ro):
         """Test getting status of existing project"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         status = gtm_service.get_project_status(domain)
         
@@ -176,7 +205,7 @@ class TestGTMGenerationService:
         assert status["progress_percentage"] == 0
         assert len(status["available_steps"]) == 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_force_regenerate_marks_stale(self, gtm_service, mock_project_with_data):
         """Test that force regeneration marks dependent steps as stale"""
         domain = mock_project_with_data.name
@@ -191,30 +220,21 @@ class TestGTMGenerationService:
         # (This is mocked, so we're testing the interface)
         assert True  # Placeholder - would check stale markers in real implementation
     
-    def test_domain_normalization_in_service(self, gtm_service):
+    @pytest.mark.parametrize("input_domain,expected_normalized", [
+        ("https://acme.com", "https://acme.com"),
+        ("www.acme.com", "https://acme.com"),
+        ("acme.com", "https://acme.com")
+    ])
+    def test_domain_normalization_in_service(self, gtm_service, input_domain, expected_normalized):
         """Test that domains are properly normalized in service calls"""
-        test_domains = [
-            ("https://acme.com", "https://acme.com"),
-            ("www.acme.com", "https://acme.com"),
-            ("acme.com", "https://acme.com")
-        ]
-        
-        for input_domain, expected_normalized in test_domains:
-            status = gtm_service.get_project_status(input_domain)
-            # The service should handle normalization internally
-            assert isinstance(status, dict)
+        status = gtm_service.get_project_status(input_domain)
+        # The service should handle normalization internally
+        assert isinstance(status, dict)
 
 
 class TestProjectStorage:
     """Test suite for Project Storage"""
     
-    @pytest.fixture
-    def storage(self, temp_project_dir):
-        """Create project storage instance with temp directory"""
-        storage = ProjectStorage()
-        storage.PROJECT_ROOT = temp_project_dir
-        return storage
-    
     def test_save_and_load_step_data(self, storage):
         """Test saving and loading step data"""
         domain = "test.com"
@@ -239,23 +259,24 @@ class TestProjectStorage:
         result = storage.load_step_data("nonexistent.com", "overview")
         assert result is None
     
-    def test_get_file_path(self, storage, temp_project_dir):
+    def test_get_file_path(self, storage):
         """Test file path generation"""
         domain = "test.com"
         step = "overview"
         
         file_path = storage.get_file_path(domain, step)
         
-        expected_path = temp_project_dir / domain / f"{step}.json"
+        expected_path = storage.base_dir / domain / f"{step}.json"
         assert file_path == expected_path
     
-    def test_list_projects(self, storage, mock_project_with_data, mock_incomplete_project):
+    def test_list_projects(self, temp_project_dir, mock_project_with_data_ro, mock_incomplete_project):
         """Test listing all projects"""
+        storage = ProjectStorage(str(temp_project_dir))
         projects = storage.list_projects()
         
         assert len(projects) >= 2
-        project_domains = [p["domain"] for p in projects]
-        assert mock_project_with_data.name in project_domains
+        project_domains = {p["domain"] for p in projects}
+        assert mock_project_with_data_ro.name in project_domains
         assert mock_incomplete_project.name in project_domains
     
     def test_list_projects_empty(self, storage):
@@ -263,7 +284,7 @@ class TestProjectStorage:
         projects = storage.list_projects()
         assert len(projects) == 0
     
-    def test_project_directory_creation(self, storage, temp_project_dir):
+    def test_project_directory_creation(self, storage):
         """Test that project directories are created automatically"""
         domain = "new-project.com"
         step = "overview"
@@ -272,7 +293,7 @@ class TestProjectStorage:
         # Save data should create directory
         storage.save_step_data(domain, step, data)
         
-        project_dir = temp_project_dir / domain
+        project_dir = storage.base_dir / domain
         assert project_dir.exists()
         assert project_dir.is_dir()
     
@@ -288,15 +309,15 @@ class TestProjectStorage:
         assert "_generated_at" in loaded_data
         assert loaded_data["company_name"] == "Metadata Corp"
     
-    def test_handle_corrupted_json(self, storage, temp_project_dir):
+    def test_handle_corrupted_json(self, storage):
         """Test handling of corrupted JSON files"""
         domain = "corrupted.com"
-        project_dir = temp_project_dir / domain
+        project_dir = storage.base_dir / domain
         project_dir.mkdir()
         
         # Write corrupted JSON
         json_file = project_dir / "overview.json"
-        json_file.write_text("{corrupted json")
+        json_file.write_bytes(b"{corrupted json")
         
         # Should handle gracefully
         result = storage.load_step_data(domain, "overview")
@@ -319,7 +340,7 @@ class TestProjectStorage:
         loaded_data = storage.load_step_data(domain, step)
         assert loaded_data["version"] == 2
     
-    def test_metadata_management(self, storage, temp_project_dir):
+    def test_metadata_management(self, storage):
         """Test project metadata creation and loading"""
         domain = "metadata-project.com"
         step = "overview"
@@ -328,22 +349,65 @@ class TestProjectStorage:
         # Save step data
         storage.save_step_data(domain, step, data)
         
-        # Check if metadata file is created
-        metadata_file = temp_project_dir / domain / ".metadata.json"
-        if metadata_file.exists():  # Implementation may or may not create this
-            metadata_content = json.loads(metadata_file.read_text())
-            assert "domain" in metadata_content or "created_at" in metadata_content
+        # save_step_data always records the step in the project metadata
+        metadata_file = storage.base_dir / domain / ".metadata.json"
+        metadata_content = _loads(metadata_file.read_bytes())
+        assert metadata_content["domain"] == domain
+        assert "created_at" in metadata_content
+        assert metadata_content["completed_steps"] == [step]
+        
+        metadata = storage.load_metadata(domain)
+        assert metadata is not None
+        assert metadata.last_step == step
+    
+    def test_read_metadata_cached_revalidates_by_stat(self, tmp_path):
+        """Test cached metadata reads skip the loader until the file changes"""
+        metadata_file = tmp_path / ".metadata.json"
+        metadata_file.write_text('{"steps_completed": []}')
+        loader = Mock(side_effect=lambda path: _loads(Path(path).read_bytes()))
+        
+        first = read_metadata_cached(metadata_file, loader)
+        second = read_metadata_cached(metadata_file, loader)
+        
+        assert second is first
+        assert loader.call_count == 1
+        
+        # A different size invalidates the entry even within the same mtime tick
+        metadata_file.write_text('{"steps_completed": ["overview"]}')
+        third = read_metadata_cached(metadata_file, loader)
+        
+        assert third == {"steps_completed": ["overview"]}
+        assert loader.call_count == 2
+    
+    def test_write_json_file_matches_stdlib_format(self, storage):
+        """Test step files are written as indented, non-ASCII-escaped JSON"""
+        data = {"company_name": "Café Corp", "steps": [1, {"nested": None}], "empty": {}}
+        step_file = storage.base_dir / "step.json"
+        
+        write_json_file(step_file, data)
+        
+        assert step_file.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+    
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_write_json_file_output_independent_of_orjson(self, storage, monkeypatch, use_orjson):
+        """Test values orjson encodes differently are still written exactly as json.dump writes them"""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr("cli.services.project_storage.ORJSON_AVAILABLE", use_orjson)
+        data = {"score": float("nan"), "ceiling": float("inf"), "big": 2 ** 70, "scale": 1e16, "ratio": 0.25}
+        step_file = storage.base_dir / "step.json"
+        
+        write_json_file(step_file, data)
+        
+        assert step_file.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
 
 
 class TestServiceIntegration:
     """Test integration between services"""
     
-    @pytest.mark.asyncio
-    async def test_full_generation_pipeline(self, temp_project_dir, mock_llm_responses):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_full_generation_pipeline(self, gtm_service, mock_llm_responses):
         """Test complete generation pipeline from overview to email"""
-        gtm_service = GTMGenerationService()
-        gtm_service.storage.PROJECT_ROOT = temp_project_dir
-        
         domain = "pipeline-test.com"
         
         # Step 1: Generate overview
@@ -374,40 +438,34 @@ class TestServiceIntegration:
         )
         assert email is not None
         
-        # Verify all data is saved
-        assert gtm_service.storage.load_step_data(domain, "overview") is not None
-        assert gtm_service.storage.load_step_data(domain, "account") is not None
-        assert gtm_service.storage.load_step_data(domain, "persona") is not None
-        assert gtm_service.storage.load_step_data(domain, "email") is not None
+        # Verify all data is saved (existence only; the step results were checked above)
+        saved_steps = set(gtm_service.storage.get_available_steps(domain))
+        assert {"overview", "account", "persona", "email"} <= saved_steps
     
-    def test_service_error_handling(self, temp_project_dir, mock_error_scenarios):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_service_error_handling(self, gtm_service, mock_error_scenarios):
         """Test service error handling"""
-        gtm_service = GTMGenerationService()
-        gtm_service.storage.PROJECT_ROOT = temp_project_dir
-        
         mock_error_scenarios["set"]("api_error")
         
         # Should handle LLM errors gracefully
         with pytest.raises(Exception):  # Expected to raise exception
-            import asyncio
-            asyncio.run(gtm_service.generate_company_overview(
+            await gtm_service.generate_company_overview(
                 domain="error-test.com",
                 force_regenerate=True
-            ))
+            )
     
-    def test_storage_persistence_across_service_instances(self, temp_project_dir):
+    def test_storage_persistence_across_service_instances(self, gtm_service, temp_project_dir):
         """Test that data persists across different service instances"""
-        # Create first service instance and save data
-        service1 = GTMGenerationService()
-        service1.storage.PROJECT_ROOT = temp_project_dir
+        # Save through the shared service instance
+        service1 = gtm_service
         
         domain = "persistence-test.com"
         test_data = {"company_name": "Persistent Corp", "_generated_at": "2024-01-01T00:00:00Z"}
         service1.storage.save_step_data(domain, "overview", test_data)
         
-        # Create second service instance and load data
-        service2 = GTMGenerationService()
-        service2.storage.PROJECT_ROOT = temp_project_dir
+        # Create second service instance over its own storage and load data from disk
+        service2 = GTMGenerationService(storage=ProjectStorage(str(temp_project_dir)))
+        assert service2.storage is not service1.storage
         
         loaded_data = service2.storage.load_step_data(domain, "overview")
         assert loaded_data is not None
@@ -417,42 +475,52 @@ class TestServiceIntegration:
 class TestServicePerformance:
     """Test performance characteristics of services"""
     
-    def test_storage_operations_performance(self, storage):
-        """Test that storage operations complete quickly"""
-        import time
+    @pytest.mark.slow
+    def test_storage_save_performance(self, benchmark, storage):
+        """Test that saving step data completes quickly"""
+        domain = "performance-test.com"
+        large_data = {"large_field": _LARGE_FIELD}  # 10KB data
+        
+        benchmark.pedantic(storage.save_step_data, args=(domain, "overview", large_data),
+                           rounds=5, warmup_rounds=1)
         
+        assert storage.load_step_data(domain, "overview")["large_field"] == _LARGE_FIELD
+        # Should complete quickly (less than 1 second); no stats when benchmarking is disabled
+        if not benchmark.disabled:
+            assert benchmark.stats["median"] < 1.0
+    
+    @pytest.mark.slow
+    def test_storage_load_performance(self, benchmark, storage):
+        """Test that loading step data completes quickly"""
         domain = "performance-test.com"
-        large_data = {"large_field": "x" * 10000}  # 10KB data
-        
-        # Time save operation
-        start_time = time.time()
-        storage.save_step_data(domain, "overview", large_data)
-        save_time = time.time() - start_time
-        
-        # Time load operation
-        start_time = time.time()
-        loaded_data = storage.load_step_data(domain, "overview")
-        load_time = time.time() - start_time
-        
-        # Should complete quickly (less than 1 second each)
-        assert save_time < 1.0
-        assert load_time < 1.0
-        assert loaded_data["large_field"] == "x" * 10000
+        storage.save_step_data(domain, "overview", {"large_field": _LARGE_FIELD})  # 10KB data
+        
+        loaded_data = benchmark.pedantic(storage.load_step_data, args=(domain, "overview"),
+                                         rounds=5, warmup_rounds=1)
+        
+        assert loaded_data["large_field"] == _LARGE_FIELD
+        # Should complete quickly (less than 1 second); no stats when benchmarking is disabled
+        if not benchmark.disabled:
+            assert benchmark.stats["median"] < 1.0
     
-    def test_multiple_projects_handling(self, storage):
+    @pytest.mark.parametrize("project_count", [
+        3,
+        pytest.param(100, marks=pytest.mark.slow),
+    ])
+    def test_multiple_projects_handling(self, storage, project_count):
         """Test handling multiple projects efficiently"""
         # Create multiple projects
-        for i in range(10):
+        for i in range(project_count):
             domain = f"project-{i}.com"
             data = {"project_id": i, "name": f"Project {i}"}
             storage.save_step_data(domain, "overview", data)
         
         # List all projects
         projects = storage.list_projects()
-        assert len(projects) == 10
+        assert len(projects) == project_count
         
         # Verify each project data
-        for i in range(10):
+        for i in range(project_count):
             domain = f"project-{i}.com"
             data = storage.load_step_data(domain, "overview")
             assert data["project_id"] == i
\ No newline at end of file
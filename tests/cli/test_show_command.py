@@ -5,128 +5,120 @@ Tests displaying generated GTM assets with rich formatting.
 
 import pytest
 import json
-from unittest.mock import patch, Mock
-from typer.testing import CliRunner
+from rich.console import Console
 
 from cli.main import app
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# ~23KB description for the large content test, built once at import
+_LARGE_DESC = "Very long description. " * 1000
+
+
+@pytest.fixture(autouse=True)
+def _fast_console(monkeypatch):
+    """Swap the show command's console for a plain one: no color, markup or highlighting
+    
+    Assertions here only match substrings (emoji included, which a plain
+    console still writes), so Rich's markup parsing and highlighting is wasted
+    work. file is left unset so output still goes to the captured sys.stdout.
+    """
+    import cli.commands.show
+    monkeypatch.setattr(cli.commands.show, "console", Console(
+        color_system=None, width=200, highlight=False, markup=False, legacy_windows=False,
+    ))
+
 
 class TestShowCommand:
     """Test suite for the show command"""
     
-    def test_show_all_assets_single_project(self, mock_cli_runner, mock_project_with_data):
+    def test_show_all_assets_single_project(self, mock_cli_runner, mock_project_with_data_ro, capsys):
         """Test showing all assets when only one project exists"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
-        result = mock_cli_runner.invoke(app, ["show", "all"])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="all")
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert f"GTM Project: {domain}" in result.output
-        assert "Progress:" in result.output
-        assert "Company Overview" in result.output
-        assert "Target Account Profile" in result.output
+        assert exit_code == 0
+        assert f"GTM Project: {domain}" in output
+        assert "Progress:" in output
+        assert "Company Overview" in output
+        assert "Target Account Profile" in output
     
-    def test_show_all_assets_with_domain(self, mock_cli_runner, mock_project_with_data):
+    def test_show_all_assets_with_domain(self, mock_cli_runner, mock_project_with_data_ro, capsys):
         """Test showing all assets for specific domain"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert f"GTM Project: {domain}" in result.output
-        assert "Available steps:" in result.output
-    
-    def test_show_single_asset_overview(self, mock_cli_runner, mock_project_with_data):
-        """Test showing company overview asset"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert "Company Overview" in result.output
-        assert "Acme Corporation" in result.output  # From mock data
-    
-    def test_show_single_asset_account(self, mock_cli_runner, mock_project_with_data):
-        """Test showing target account asset"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "account", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert "Target Account Profile" in result.output
-        assert "Technology" in result.output  # From mock data
-    
-    def test_show_single_asset_persona(self, mock_cli_runner, mock_project_with_data):
-        """Test showing buyer persona asset"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "persona", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert "Buyer Persona" in result.output
-        assert "VP of Operations" in result.output  # From mock data
-    
-    def test_show_single_asset_email(self, mock_cli_runner, mock_project_with_data):
-        """Test showing email campaign asset"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "email", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert "Email Campaign" in result.output
-        assert "Transform Your Operations" in result.output  # From mock data
-    
-    def test_show_single_asset_strategy(self, mock_cli_runner, mock_project_with_data):
-        """Test showing GTM strategy asset"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "strategy", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert "GTM Strategic Plan" in result.output
-    
-    def test_show_json_output_overview(self, mock_cli_runner, mock_project_with_data):
-        """Test JSON output format for overview"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--json", "--domain", domain])
-        
-        assert result.exit_code == 0
+        domain = mock_project_with_data_ro.name
+        
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="all", domain=domain)
+        output = capsys.readouterr().out
+        
+        assert exit_code == 0
+        assert f"GTM Project: {domain}" in output
+        assert "Available steps:" in output
+    
+    @pytest.mark.parametrize("step,expected", [
+        ("overview", ("Company Overview", "Acme Corporation")),
+        ("account", ("Target Account Profile", "Technology")),
+        ("persona", ("Buyer Persona", "VP of Operations")),
+        ("email", ("Email Campaign", "Transform Your Operations")),
+        ("strategy", ("GTM Strategic Plan",)),
+    ], ids=["overview", "account", "persona", "email", "strategy"])
+    def test_show_single_asset(self, mock_cli_runner, mock_project_with_data_ro, capsys, step, expected):
+        """Test showing each single asset with its title and mock data"""
+        domain = mock_project_with_data_ro.name
+        
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step=step, domain=domain)
+        output = capsys.readouterr().out
+        
+        assert exit_code == 0
+        for text in expected:
+            assert text in output
+    
+    @pytest.mark.parametrize("step,field", [
+        ("overview", "company_name"),
+        ("account", "firmographics"),
+    ], ids=["overview", "account"])
+    def test_show_json_output(self, mock_cli_runner, mock_project_with_data_ro, capsys, step, field):
+        """Test JSON output format for single assets"""
+        domain = mock_project_with_data_ro.name
+        
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step=step, json_output=True, domain=domain)
+        output = capsys.readouterr().out
+        
+        assert exit_code == 0
         # Should contain JSON syntax highlighting
-        assert "{" in result.output
-        assert "company_name" in result.output
-    
-    def test_show_json_output_account(self, mock_cli_runner, mock_project_with_data):
-        """Test JSON output format for account"""
-        domain = mock_project_with_data.name
-        
-        result = mock_cli_runner.invoke(app, ["show", "account", "--json", "--domain", domain])
-        
-        assert result.exit_code == 0
-        assert "{" in result.output
-        assert "firmographics" in result.output
+        assert "{" in output
+        assert field in output
     
-    def test_show_nonexistent_project(self, mock_cli_runner, temp_project_dir):
+    def test_show_nonexistent_project(self, mock_cli_runner, temp_project_dir, capsys):
         """Test showing assets for non-existent project"""
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", "nonexistent.com"])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="all", domain="nonexistent.com")
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "No GTM project found" in result.output
-        assert "blossomer init" in result.output
+        assert exit_code == 0
+        assert "No GTM project found" in output
+        assert "blossomer init" in output
     
-    def test_show_nonexistent_asset(self, mock_cli_runner, mock_incomplete_project):
+    def test_show_nonexistent_asset(self, mock_cli_runner, mock_incomplete_project, capsys):
         """Test showing asset that doesn't exist"""
         domain = mock_incomplete_project.name
         
-        result = mock_cli_runner.invoke(app, ["show", "account", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="account", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Should handle missing asset gracefully
-        assert "not found" in result.output or "Generated: Unknown" in result.output
+        assert "not found" in output or "Generated: Unknown" in output
     
-    def test_show_invalid_asset_name(self, mock_cli_runner, mock_project_with_data):
+    def test_show_invalid_asset_name(self, mock_cli_runner, mock_project_with_data_ro):
         """Test showing invalid asset name"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         result = mock_cli_runner.invoke(app, ["show", "invalid_asset", "--domain", domain])
         
@@ -134,30 +126,31 @@ class TestShowCommand:
         assert "Unknown asset" in result.output
         assert "Available assets:" in result.output
     
-    def test_show_auto_detect_single_project(self, mock_cli_runner, mock_project_with_data):
+    def test_show_auto_detect_single_project(self, invoke_cached):
         """Test auto-detection when only one project exists"""
-        result = mock_cli_runner.invoke(app, ["show", "all"])
+        result = invoke_cached(["show", "all"])
         
         assert result.exit_code == 0
         assert "GTM Project:" in result.output
     
-    def test_show_multiple_projects_no_domain(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
+    def test_show_multiple_projects_no_domain(self, mock_cli_runner, mock_project_with_data_ro, temp_project_dir, capsys):
         """Test showing assets when multiple projects exist without specifying domain"""
         # Create second project
         second_project = temp_project_dir / "second.com"
         second_project.mkdir()
-        (second_project / "overview.json").write_text(json.dumps({
+        (second_project / "overview.json").write_bytes(_dumps({
             "company_name": "Second Company",
             "_generated_at": "2024-01-01T00:00:00Z"
         }))
         
-        result = mock_cli_runner.invoke(app, ["show", "all"])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="all")
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "Multiple projects found" in result.output
-        assert "Please specify domain" in result.output
+        assert exit_code == 0
+        assert "Multiple projects found" in output
+        assert "Please specify domain" in output
     
-    def test_show_stale_data_warning(self, mock_cli_runner, temp_project_dir):
+    def test_show_stale_data_warning(self, mock_cli_runner, temp_project_dir, capsys):
         """Test showing warning for stale data"""
         # Create project with stale data
         domain = "stale.com"
@@ -171,16 +164,17 @@ class TestShowCommand:
             "_stale": True,
             "_stale_reason": "Dependency updated"
         }
-        (project_path / "overview.json").write_text(json.dumps(overview_data))
+        (project_path / "overview.json").write_bytes(_dumps(overview_data))
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="overview", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "may be outdated" in result.output or "stale" in result.output.lower()
+        assert exit_code == 0
+        assert "may be outdated" in output or "stale" in output.lower()
     
-    def test_show_step_option_vs_argument(self, mock_cli_runner, mock_project_with_data):
+    def test_show_step_option_vs_argument(self, mock_cli_runner, mock_project_with_data_ro):
         """Test --step option vs positional argument"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         
         # Test with --step option
         result1 = mock_cli_runner.invoke(app, ["show", "--step", "overview", "--domain", domain])
@@ -192,19 +186,19 @@ class TestShowCommand:
         assert result2.exit_code == 0
         assert "Company Overview" in result2.output
     
-    def test_show_with_character_counts(self, mock_cli_runner, mock_project_with_data):
+    def test_show_with_character_counts(self, invoke_cached, cached_project):
         """Test that character counts are displayed in summaries"""
-        domain = mock_project_with_data.name
+        domain = cached_project.name
         
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", domain])
+        result = invoke_cached(["show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         # Should show some indication of content length/metadata
         assert "Generated:" in result.output or "Last updated:" in result.output
     
-    def test_show_markdown_file_content(self, mock_cli_runner, mock_project_with_data, temp_project_dir):
+    def test_show_markdown_file_content(self, mock_cli_runner, mock_project_with_data_ro, temp_project_dir, capsys):
         """Test showing markdown file content when available"""
-        domain = mock_project_with_data.name
+        domain = mock_project_with_data_ro.name
         project_path = temp_project_dir / domain
         
         # Create a markdown file
@@ -212,12 +206,14 @@ class TestShowCommand:
         plans_dir.mkdir(exist_ok=True)
         (plans_dir / "overview.md").write_text("# Company Overview\n\nThis is test content.")
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="overview", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        # Should display markdown content or reference to it
+        assert exit_code == 0
+        # The markdown body is rendered, not just referenced
+        assert "This is test content." in output
     
-    def test_show_handles_missing_metadata(self, mock_cli_runner, temp_project_dir):
+    def test_show_handles_missing_metadata(self, mock_cli_runner, temp_project_dir, capsys):
         """Test showing asset with missing metadata"""
         domain = "no-metadata.com"
         project_path = temp_project_dir / domain
@@ -228,36 +224,53 @@ class TestShowCommand:
             "company_name": "No Metadata Corp"
             # No _generated_at field
         }
-        (project_path / "overview.json").write_text(json.dumps(overview_data))
+        (project_path / "overview.json").write_bytes(_dumps(overview_data))
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="overview", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "Generated: Unknown" in result.output or "Unknown" in result.output
+        assert exit_code == 0
+        assert "Generated: Unknown" in output or "Unknown" in output
+
+
+@pytest.fixture(scope="module")
+def negative_projects(tmp_path_factory):
+    """Build the broken projects the show error-path tests read, once per module
+    
+    Returns the directory holding gtm_projects/; show never writes on these
+    paths, so the tests can share it.
+    """
+    root = tmp_path_factory.mktemp("negatives")
+    projects_dir = root / "gtm_projects"
+    (projects_dir / "corrupted.com").mkdir(parents=True)
+    (projects_dir / "corrupted.com" / "overview.json").write_text("{corrupted json content")
+    (projects_dir / "empty.com").mkdir()
+    return root
 
 
 class TestShowCommandEdgeCases:
     """Test edge cases and error conditions for show command"""
     
-    def test_show_corrupted_json_file(self, mock_cli_runner, mock_corrupted_project):
+    def test_show_corrupted_json_file(self, mock_cli_runner, negative_projects, monkeypatch, capsys):
         """Test showing asset with corrupted JSON"""
-        domain = mock_corrupted_project.name
+        monkeypatch.chdir(negative_projects)
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="overview", domain="corrupted.com")
+        output = capsys.readouterr().out
         
         # Should handle corrupted JSON gracefully
-        assert result.exit_code == 0
-        assert "not found" in result.output or "error" in result.output.lower()
+        assert exit_code == 0
+        assert "not found" in output or "error" in output.lower()
     
-    def test_show_empty_project_directory(self, mock_cli_runner, temp_project_dir):
+    def test_show_empty_project_directory(self, mock_cli_runner, negative_projects, monkeypatch, capsys):
         """Test showing assets for empty project directory"""
-        empty_project = temp_project_dir / "empty.com"
-        empty_project.mkdir()
+        monkeypatch.chdir(negative_projects)
         
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", "empty.com"])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="all", domain="empty.com")
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "No GTM project found" in result.output or "0% complete" in result.output
+        assert exit_code == 0
+        assert "No GTM project found" in output or "0% complete" in output
     
     def test_show_with_invalid_domain_format(self, mock_cli_runner):
         """Test show with invalid domain format"""
@@ -266,14 +279,15 @@ class TestShowCommandEdgeCases:
         assert result.exit_code == 0
         assert "Invalid domain format" in result.output or "No GTM project found" in result.output
     
-    def test_show_no_projects_exist(self, mock_cli_runner, temp_project_dir):
+    def test_show_no_projects_exist(self, mock_cli_runner, temp_project_dir, capsys):
         """Test show when no projects exist at all"""
         # temp_project_dir is empty
-        result = mock_cli_runner.invoke(app, ["show", "all"])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="all")
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "No GTM projects found" in result.output
-        assert "blossomer init" in result.output
+        assert exit_code == 0
+        assert "No GTM projects found" in output
+        assert "blossomer init" in output
     
     def test_show_file_permission_error(self, mock_cli_runner, mock_project_with_data):
         """Test handling file permission errors"""
@@ -295,51 +309,52 @@ class TestShowCommandEdgeCases:
 class TestShowCommandFormatting:
     """Test rich formatting features of show command"""
     
-    def test_show_rich_panel_formatting(self, mock_cli_runner, mock_project_with_data):
+    def test_show_rich_panel_formatting(self, invoke_cached, cached_project):
         """Test that rich panels are properly formatted"""
-        domain = mock_project_with_data.name
+        domain = cached_project.name
         
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", domain])
+        result = invoke_cached(["show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         # Check for rich formatting elements
         assert "Project Overview" in result.output or "GTM Project:" in result.output
     
-    def test_show_progress_percentage(self, mock_cli_runner, mock_incomplete_project):
+    def test_show_progress_percentage(self, mock_cli_runner, mock_incomplete_project, capsys):
         """Test progress percentage calculation"""
         domain = mock_incomplete_project.name
         
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="all", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Should show some progress percentage less than 100%
-        assert "%" in result.output and "Progress:" in result.output
+        assert "%" in output and "Progress:" in output
     
-    def test_show_step_icons_and_formatting(self, mock_cli_runner, mock_project_with_data):
+    def test_show_step_icons_and_formatting(self, invoke_cached, cached_project):
         """Test that step icons and formatting are displayed"""
-        domain = mock_project_with_data.name
+        domain = cached_project.name
         
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", domain])
+        result = invoke_cached(["show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         # Check for emojis or formatting
         assert "🏢" in result.output or "🎯" in result.output or "👤" in result.output
     
-    def test_show_metadata_display(self, mock_cli_runner, mock_project_with_data):
+    def test_show_metadata_display(self, invoke_cached, cached_project):
         """Test display of generation metadata"""
-        domain = mock_project_with_data.name
+        domain = cached_project.name
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        result = invoke_cached(["show", "overview", "--domain", domain])
         
         assert result.exit_code == 0
         assert "Generated:" in result.output
         assert "2024-01-01" in result.output  # From mock data
     
-    def test_show_commands_help_text(self, mock_cli_runner, mock_project_with_data):
+    def test_show_commands_help_text(self, invoke_cached, cached_project):
         """Test that helpful command suggestions are shown"""
-        domain = mock_project_with_data.name
+        domain = cached_project.name
         
-        result = mock_cli_runner.invoke(app, ["show", "all", "--domain", domain])
+        result = invoke_cached(["show", "all", "--domain", domain])
         
         assert result.exit_code == 0
         assert "Commands:" in result.output
@@ -350,7 +365,7 @@ class TestShowCommandFormatting:
 class TestShowCommandDataHandling:
     """Test data handling and validation in show command"""
     
-    def test_show_handles_missing_fields(self, mock_cli_runner, temp_project_dir):
+    def test_show_handles_missing_fields(self, mock_cli_runner, temp_project_dir, capsys):
         """Test showing data with missing expected fields"""
         domain = "minimal.com"
         project_path = temp_project_dir / domain
@@ -361,14 +376,15 @@ class TestShowCommandDataHandling:
             "company_name": "Minimal Corp"
             # Missing other expected fields
         }
-        (project_path / "overview.json").write_text(json.dumps(overview_data))
+        (project_path / "overview.json").write_bytes(_dumps(overview_data))
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="overview", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "Minimal Corp" in result.output
+        assert exit_code == 0
+        assert "Minimal Corp" in output
     
-    def test_show_handles_extra_fields(self, mock_cli_runner, temp_project_dir):
+    def test_show_handles_extra_fields(self, mock_cli_runner, temp_project_dir, capsys):
         """Test showing data with extra unexpected fields"""
         domain = "extra.com"
         project_path = temp_project_dir / domain
@@ -381,30 +397,30 @@ class TestShowCommandDataHandling:
             "extra_field": "This should not break anything",
             "nested_extra": {"more": "data"}
         }
-        (project_path / "overview.json").write_text(json.dumps(overview_data))
+        (project_path / "overview.json").write_bytes(_dumps(overview_data))
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="overview", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "Extra Corp" in result.output
+        assert exit_code == 0
+        assert "Extra Corp" in output
     
-    def test_show_large_content_handling(self, mock_cli_runner, temp_project_dir):
+    def test_show_large_content_handling(self, mock_cli_runner, temp_project_dir, capsys):
         """Test showing very large content"""
         domain = "large.com"
         project_path = temp_project_dir / domain
         project_path.mkdir()
         
         # Create overview with very large description
-        large_description = "Very long description. " * 1000  # ~23KB
-        overview_data = {
+        (project_path / "overview.json").write_bytes(_dumps({
             "company_name": "Large Corp",
-            "description": large_description,
+            "description": _LARGE_DESC,
             "_generated_at": "2024-01-01T00:00:00Z"
-        }
-        (project_path / "overview.json").write_text(json.dumps(overview_data))
+        }))
         
-        result = mock_cli_runner.invoke(app, ["show", "overview", "--domain", domain])
+        exit_code = mock_cli_runner.invoke_fast(app, "show", step="overview", domain=domain)
+        output = capsys.readouterr().out
         
-        assert result.exit_code == 0
-        assert "Large Corp" in result.output
+        assert exit_code == 0
+        assert "Large Corp" in output
         # Should handle large content without issues
\ No newline at end of file
@@ -3,20 +3,31 @@ Shared test fixtures for the Blossomer GTM CLI test suite.
 This file contains all mock fixtures to avoid LLM API costs.
 """
 
+import sys
+
+# Test runs are ephemeral; skip writing .pyc files for everything imported below
+sys.dont_write_bytecode = True
+
 import pytest
+import copy
 import json
 import os
+import shutil
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 from typing import Dict, Any
 
 # Add CLI modules to path for imports
-import sys
 cli_root = Path(__file__).parent.parent
 sys.path.insert(0, str(cli_root))
 
 
+def pytest_configure(config):
+    """Register custom markers (pytest.ini's [tool:pytest] section is not read by pytest)"""
+    config.addinivalue_line("markers", "slow: Tests that take longer to run")
+
+
 @pytest.fixture
 def mock_api_keys(monkeypatch):
     """Mock API keys to be present for tests"""
@@ -30,6 +41,9 @@ def temp_project_dir(tmp_path, monkeypatch):
     project_dir = tmp_path / "gtm_projects"
     project_dir.mkdir()
     
+    # Commands resolve the relative "gtm_projects" path against the cwd
+    monkeypatch.chdir(tmp_path)
+    
     # Mock the ProjectStorage class to use temp directory
     original_init = None
     try:
@@ -46,9 +60,8 @@ def temp_project_dir(tmp_path, monkeypatch):
     return project_dir
 
 
-@pytest.fixture
-def mock_llm_responses():
-    """Provide realistic mock responses for all LLM calls"""
+def build_mock_llm_responses() -> Dict[str, Any]:
+    """Build a fresh copy of the realistic mock responses for all LLM calls"""
     return {
         "overview": {
             "company_name": "Acme Corporation",
@@ -330,8 +343,13 @@ This strategic plan provides a comprehensive framework for successful go-to-mark
 
 
 @pytest.fixture
-def mock_firecrawl_response():
-    """Mock Firecrawl API response for website scraping"""
+def mock_llm_responses():
+    """Provide realistic mock responses for all LLM calls"""
+    return build_mock_llm_responses()
+
+
+def build_mock_firecrawl_response() -> Dict[str, Any]:
+    """Build a fresh copy of the Firecrawl API response for website scraping"""
     return {
         "content": """
         <html>
@@ -376,9 +394,17 @@ def mock_firecrawl_response():
     }
 
 
-@pytest.fixture(autouse=True)
-def mock_all_external_calls(monkeypatch, mock_llm_responses, mock_firecrawl_response, mock_api_keys):
-    """Automatically mock all external API calls to prevent costs"""
+@pytest.fixture
+def mock_firecrawl_response():
+    """Mock Firecrawl API response for website scraping"""
+    return build_mock_firecrawl_response()
+
+
+@pytest.fixture(scope="session")
+def _external_call_mocks():
+    """Install the external API mocks once per session; yields the LLM AsyncMock"""
+    mock_llm_responses = build_mock_llm_responses()
+    mock_firecrawl_response = build_mock_firecrawl_response()
     
     # Mock LLM service calls
     async def mock_llm_generate(prompt=None, system_prompt: str = None, response_model=None, **kwargs):
@@ -414,10 +440,10 @@ def mock_all_external_calls(monkeypatch, mock_llm_responses, mock_firecrawl_resp
         else:
             response_data = {"default": "mock response"}
         
-        # If response_model is provided (structured output), return the data as-is
-        # Otherwise return JSON string for compatibility
+        # If response_model is provided (structured output), return a copy of the data
+        # (callers add keys such as _generated_at); otherwise return a JSON string
         if response_model:
-            return response_data
+            return copy.deepcopy(response_data)
         else:
             return json.dumps(response_data)
     
@@ -429,41 +455,53 @@ def mock_all_external_calls(monkeypatch, mock_llm_responses, mock_firecrawl_resp
     mock_client.generate = mock_llm
     mock_client.generate_structured_output = mock_llm
     
-    # Mock the singleton function to return our mock client
-    try:
-        monkeypatch.setattr("cli.services.llm_singleton.get_llm_client", lambda **kwargs: mock_client)
-    except (ImportError, AttributeError):
-        pass  # Service might not exist
-    
-    # Mock app services without importing them directly
-    try:
-        import app.services.llm_service
-        monkeypatch.setattr("app.services.llm_service.LLMClient.generate", mock_llm)
-    except ImportError:
-        # App service isn't available in CLI test environment - that's OK
-        pass
-    
-    # Mock Firecrawl website scraping
-    def mock_firecrawl_scrape(*args, **kwargs):
-        return mock_firecrawl_response
-    
-    # Mock the actual functions that exist
-    monkeypatch.setattr("app.services.website_scraper.firecrawl_scrape_url", mock_firecrawl_scrape)
-    monkeypatch.setattr("app.services.website_scraper.get_processed_website_content", 
-                       lambda url: mock_firecrawl_response["content"])
-    
-    # Mock web content service if it exists
-    try:
-        monkeypatch.setattr("app.services.web_content_service.WebContentService.fetch_website_content", 
-                           lambda self, url: mock_firecrawl_response)
-    except AttributeError:
-        pass  # Service might not exist
-    
-    # Mock any other external API calls
-    monkeypatch.setattr("requests.get", Mock(return_value=Mock(json=lambda: mock_firecrawl_response)))
-    monkeypatch.setattr("requests.post", Mock(return_value=Mock(json=lambda: mock_firecrawl_response)))
-    
-    return mock_llm
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Mock the singleton function to return our mock client
+        try:
+            monkeypatch.setattr("cli.services.llm_singleton.get_llm_client", lambda **kwargs: mock_client)
+        except (ImportError, AttributeError):
+            pass  # Service might not exist
+        
+        # Mock app services without importing them directly
+        try:
+            import app.services.llm_service
+            monkeypatch.setattr("app.services.llm_service.LLMClient.generate", mock_llm)
+        except ImportError:
+            # App service isn't available in CLI test environment - that's OK
+            pass
+        
+        # Mock Firecrawl website scraping
+        def mock_firecrawl_scrape(*args, **kwargs):
+            return mock_firecrawl_response
+        
+        # Mock the actual functions that exist
+        monkeypatch.setattr("app.services.website_scraper.firecrawl_scrape_url", mock_firecrawl_scrape)
+        monkeypatch.setattr("app.services.website_scraper.get_processed_website_content", 
+                           lambda url: mock_firecrawl_response["content"])
+        
+        # Mock web content service if it exists
+        try:
+            monkeypatch.setattr("app.services.web_content_service.WebContentService.fetch_website_content", 
+                               lambda self, url: mock_firecrawl_response)
+        except AttributeError:
+            pass  # Service might not exist
+        
+        # Mock any other external API calls
+        monkeypatch.setattr("requests.get", Mock(return_value=Mock(json=lambda: mock_firecrawl_response)))
+        monkeypatch.setattr("requests.post", Mock(return_value=Mock(json=lambda: mock_firecrawl_response)))
+        
+        yield mock_llm
+
+
+@pytest.fixture(autouse=True)
+def mock_all_external_calls(_external_call_mocks, mock_api_keys):
+    """Automatically mock all external API calls to prevent costs"""
+    smart_side_effect = _external_call_mocks.side_effect
+    yield _external_call_mocks
+    # The mock outlives the test, so drop any return_value/side_effect a test
+    # configured before handing it to the next one
+    _external_call_mocks.reset_mock(return_value=True, side_effect=True)
+    _external_call_mocks.side_effect = smart_side_effect
 
 
 @pytest.fixture
@@ -472,15 +510,15 @@ def sample_project_data(mock_llm_responses):
     return mock_llm_responses
 
 
-@pytest.fixture
-def mock_project_with_data(temp_project_dir, sample_project_data):
-    """Create a complete mock project with all steps"""
+@pytest.fixture(scope="session")
+def _base_project(tmp_path_factory):
+    """Build the complete mock project with all steps once per session"""
     domain = "acme.com"
-    project_path = temp_project_dir / domain
+    project_path = tmp_path_factory.mktemp("base_project") / domain
     project_path.mkdir()
     
     # Create JSON files for each step
-    for step, data in sample_project_data.items():
+    for step, data in build_mock_llm_responses().items():
         if step != "strategy":  # Strategy is stored differently
             json_path = project_path / f"{step}.json"
             json_path.write_text(json.dumps(data, indent=2))
@@ -498,6 +536,26 @@ def mock_project_with_data(temp_project_dir, sample_project_data):
     return project_path
 
 
+@pytest.fixture
+def mock_project_with_data(temp_project_dir, _base_project):
+    """Create a complete mock project with all steps (copied from the session project)"""
+    project_path = temp_project_dir / _base_project.name
+    shutil.copytree(_base_project, project_path)
+    return project_path
+
+
+@pytest.fixture
+def mock_project_with_data_ro(temp_project_dir, _base_project):
+    """Hardlink the session project for tests that never rewrite its files
+    
+    Directories are real, so new files and chmod on directories stay local;
+    writing to an existing file would change the shared session copy.
+    """
+    project_path = temp_project_dir / _base_project.name
+    shutil.copytree(_base_project, project_path, copy_function=os.link)
+    return project_path
+
+
 @pytest.fixture
 def mock_incomplete_project(temp_project_dir):
     """Create a mock project with only some steps completed"""
@@ -539,11 +597,170 @@ def mock_corrupted_project(temp_project_dir):
     return project_path
 
 
-@pytest.fixture
-def mock_cli_runner():
-    """Create a Typer CLI runner for testing commands"""
+@pytest.fixture(scope="session")
+def app_warm():
+    """Import the Typer app and warm its command tree once per session"""
     from typer.testing import CliRunner
-    return CliRunner()
+    from cli.main import app
+    
+    # Commands import their implementations lazily; pull the common ones in up front
+    import cli.commands.list_projects  # noqa: F401
+    import cli.commands.show  # noqa: F401
+    
+    CliRunner().invoke(app, ["--help"])
+    return app
+
+
+@pytest.fixture(scope="session")
+def mock_cli_runner(app_warm):
+    """Create a Typer CLI runner for testing commands
+    
+    The runner is shared across the session: CliRunner keeps no state between
+    invokes (everything lives on the returned Result), so tests must not set
+    attributes on it.
+    
+    runner.invoke_fast(app, name, **kwargs) calls the command's callback
+    directly, skipping Click parsing and CliRunner's stream isolation, and
+    returns the exit code. Output goes to the real stdout, so read it with
+    capsys.
+    """
+    import inspect
+    import typer
+    from typer.models import ParameterInfo
+    from typer.testing import CliRunner
+    
+    # Plain, fixed-width output: assertions only look at text, not styling
+    runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb", "COLUMNS": "80"})
+    
+    def invoke_fast(app, name, **kwargs):
+        for info in app.registered_commands:
+            if (info.name or info.callback.__name__.replace("_", "-")) == name:
+                break
+        else:
+            raise LookupError(f"No command named {name!r}")
+        
+        # Resolve typer.Option/typer.Argument defaults to their plain values
+        params = {}
+        for param in inspect.signature(info.callback).parameters.values():
+            default = param.default
+            if isinstance(default, ParameterInfo):
+                default = default.default
+            params[param.name] = default
+        params.update(kwargs)
+        
+        try:
+            info.callback(**params)
+        except typer.Exit as e:
+            return e.exit_code
+        return 0
+    
+    runner.invoke_fast = invoke_fast
+    return runner
+
+
+def replay_invocations(invoke):
+    """Wrap invoke(args) so each distinct argv runs once and later calls replay its Result
+    
+    The memo lives as long as the returned function, so a fixture's scope
+    bounds it.
+    """
+    from functools import lru_cache
+    
+    @lru_cache(maxsize=None)
+    def _invoke_static(args_tuple):
+        return invoke(list(args_tuple))
+    
+    def _invoke(args):
+        return _invoke_static(tuple(args))
+    
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def invoke_recorded(app_warm):
+    """Invoke an argument-only command once per session and replay its Result
+    
+    Only for invocations whose output depends on nothing but the app itself
+    (--help, --version, the bare welcome screen, an unknown command).
+    Anything that reads projects or other fixtures must go through
+    mock_cli_runner.
+    """
+    from typer.testing import CliRunner
+    
+    runner = CliRunner()
+    return replay_invocations(lambda args: runner.invoke(app_warm, args))
+
+
+@pytest.fixture(scope="class")
+def cached_project(tmp_path_factory, _base_project):
+    """Hardlink the session project into a gtm_projects dir shared by one test class"""
+    root = tmp_path_factory.mktemp("cached_project")
+    project_path = root / "gtm_projects" / _base_project.name
+    shutil.copytree(_base_project, project_path, copy_function=os.link)
+    return project_path
+
+
+@pytest.fixture(scope="class")
+def invoke_cached(app_warm, mock_cli_runner, cached_project):
+    """Invoke a command against cached_project once per class and replay its Result
+    
+    Only for read-only commands (show, list) whose output depends on nothing
+    but the argv and the unmodified cached_project; the cwd is switched to its
+    root for the duration of each real invoke.
+    """
+    root = cached_project.parent.parent
+    
+    def _invoke_in_root(args):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.chdir(root)
+            return mock_cli_runner.invoke(app_warm, args)
+    
+    return replay_invocations(_invoke_in_root)
+
+
+@pytest.fixture
+def invoke_silent(app_warm):
+    """Invoke a CLI command with output discarded and return only its exit code
+    
+    For tests that assert on nothing but the exit code; skips the StringIO
+    capture and decoding CliRunner does for every invocation.
+    """
+    import typer
+    try:
+        import click
+    except ImportError:
+        # Newer Typer releases vendor Click instead of depending on it
+        from typer import _click as click
+    from contextlib import redirect_stderr, redirect_stdout
+    
+    def _invoke(app, args):
+        command = typer.main.get_command(app)
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull), redirect_stderr(devnull):
+            try:
+                rv = command.main(args=list(args), prog_name="blossomer", standalone_mode=False)
+            except click.exceptions.ClickException as e:
+                return e.exit_code
+            except click.exceptions.Abort:
+                return 1
+            except SystemExit as e:
+                return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        # Non-standalone mode returns the exit code when a command exits explicitly
+        return rv if isinstance(rv, int) else 0
+    
+    return _invoke
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+    PYTEST_BENCHMARK_AVAILABLE = True
+except ImportError:
+    PYTEST_BENCHMARK_AVAILABLE = False
+
+if not PYTEST_BENCHMARK_AVAILABLE:
+    @pytest.fixture
+    def benchmark():
+        """Skip timing tests when pytest-benchmark is not installed"""
+        pytest.skip("pytest-benchmark not installed")
 
 
 @pytest.fixture
@@ -643,4 +860,23 @@ def create_test_project():
             # Add other steps as needed
         
         return project_data
-    return _create
\ No newline at end of file
+    return _create
+
+@pytest.fixture(scope="session")
+def make_projects():
+    """Factory for batch-creating project directories that hold an overview.json body"""
+    def _create(base_dir, projects):
+        # Open the base directory once and create everything relative to it
+        base_fd = os.open(base_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for domain, payload in projects:
+                os.mkdir(domain, dir_fd=base_fd)
+                fd = os.open(f"{domain}/overview.json",
+                             os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=base_fd)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+        finally:
+            os.close(base_fd)
+    return _create
@@ -4,6 +4,7 @@ Test runner for the Blossomer GTM CLI test suite.
 Provides different test execution modes and reporting.
 """
 
+import os
 import sys
 import argparse
 import subprocess
@@ -16,7 +17,9 @@ def run_command(cmd, description=""):
         print(f"\n🏃 {description}")
     print(f"Running: {' '.join(cmd)}")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Skip .pyc writes for the short-lived test processes
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
     
     if result.returncode == 0:
         print("✅ Success")
@@ -126,6 +129,21 @@ def run_fast_tests():
     return run_command(cmd, "Running fast tests only")
 
 
+def run_cli_fast_tests():
+    """Run the CLI command tests with unused pytest plugins disabled"""
+    cmd = [
+        "pytest",
+        "-p", "no:cacheprovider",
+        "-p", "no:doctest",
+        "-p", "no:pastebin",
+        "-p", "no:nose",
+        "--no-header",
+        "-q",
+        "tests/cli/test_other_commands.py",
+    ]
+    return run_command(cmd, "Running CLI command tests (fast profile)")
+
+
 def run_smoke_tests():
     """Run smoke tests (basic functionality)"""
     cmd = [
@@ -184,7 +202,7 @@ def main():
     parser = argparse.ArgumentParser(description="Run Blossomer GTM CLI tests")
     parser.add_argument("--mode", choices=[
         "unit", "integration", "e2e", "error", "all", "coverage", 
-        "fast", "smoke", "performance", "lint", "report"
+        "fast", "cli-fast", "smoke", "performance", "lint", "report"
     ], default="all", help="Test mode to run")
     
     parser.add_argument("--no-mock-check", action="store_true", 
@@ -227,6 +245,8 @@ def main():
         exit_code = run_with_coverage()
     elif args.mode == "fast":
         exit_code = run_fast_tests()
+    elif args.mode == "cli-fast":
+        exit_code = run_cli_fast_tests()
     elif args.mode == "smoke":
         exit_code = run_smoke_tests()
     elif args.mode == "performance":